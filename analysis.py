@@ -3,13 +3,235 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.artist import setp
+from matplotlib.figure import Figure
+from matplotlib.backend_bases import FigureCanvasBase
 import matplotlib.dates as mdates # Import for date formatting/locating
+from matplotlib.collections import PolyCollection
 from datetime import timedelta, datetime # Import datetime explicitly
 import traceback
+import hashlib
+import io
+from collections import OrderedDict
 import config # Import configuration for colors
 
-def plot_analysis_charts(df, disease_name, target_col_name, source_info=""):
+# --- Plot Colors ---
+# Resolved once at import (config has already applied the dark style by then)
+_COLORS = config.PLOT_COLORS_DARK
+_TEXT_COLOR = matplotlib.rcParams['text.color']
+_EDGE_COLOR = matplotlib.rcParams['axes.edgecolor']
+_BAR_COLOR_MAP = { # target -> (bar color, 7-day avg line color)
+    'cases': (_COLORS["daily_cases"], _COLORS["avg_line_cases"]),
+    'deaths': (_COLORS["daily_deaths"], _COLORS["avg_line_deaths"]),
+}
+_FALLBACK_BAR_COLORS = ("#CCCCCC", "#999999")
+
+
+def _make_target_spec(target_col_name):
+    """Pre-formats the target-dependent colors, column name and panel labels for one target."""
+    label = target_col_name.capitalize() # "Cases" or "Deaths"
+    bar_color, avg_color = _BAR_COLOR_MAP.get(target_col_name, _FALLBACK_BAR_COLORS)
+    return {
+        "label": label, "avg_col": f"{target_col_name}_7d_avg",
+        "bar_color": bar_color, "avg_color": avg_color,
+        "daily_label": f'Daily {label}',
+        "daily_title": f'Daily {label} and 7-Day Average',
+        "daily_ylabel": f'Number of {label}',
+        "growth_title": f'Daily {label} Growth Rate (%)',
+        "monthly_title": f'Average Daily {label} per Month',
+        "monthly_ylabel": f'Avg {label}',
+    }
+
+# Built once for the known targets; other targets are specialized on first use
+_TARGET_SPECS = {target.lower(): _make_target_spec(target.lower()) for target in config.ANALYSIS_TARGETS}
+
+
+def _target_spec(target_col_name):
+    """Returns the cached plot spec for a target column."""
+    spec = _TARGET_SPECS.get(target_col_name)
+    if spec is None:
+        spec = _TARGET_SPECS[target_col_name] = _make_target_spec(target_col_name)
+    return spec
+
+_MONTH_LABELS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+# --- Figure Cache ---
+# Maps (disease, target, source_info, data fingerprint) -> Figure, oldest first.
+_figure_cache = OrderedDict()
+_spare_figure = None # Last evicted Figure, cleared and redrawn instead of allocating a new one
+_ERROR_FIGURE_LABEL = "analysis-error" # Figure label of the error placeholder, which is never cached
+
+
+def _df_fingerprint(df, cols):
+    """Returns a short content hash of the given DataFrame columns (index included)."""
+    row_hashes = pd.util.hash_pandas_object(df[cols], index=True).values
+    return hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+
+
+def plot_analysis_charts(df, disease_name, target_col_name, source_info="", return_array=False):
+    """
+    Returns the 3-panel analysis figure, reusing a cached Figure when the same
+    disease/target/source and identical data were already plotted.
+    See _build_analysis_charts for the panel layout and arguments.
+
+    With return_array=True the figure is rasterized offscreen (Agg) and an
+    (H, W, 4) uint8 RGBA array is returned instead, ready for
+    PIL.Image.fromarray / a Tk PhotoImage without a matplotlib Tk canvas.
+    """
+    fig = _get_analysis_figure(df, disease_name, target_col_name, source_info)
+    if return_array and fig is not None:
+        return _render_rgba(fig)
+    return fig
+
+
+def _render_rgba(fig):
+    """
+    Rasterizes the figure with Agg and returns its RGBA pixels. savefig swaps in a
+    temporary canvas and restores fig.canvas afterwards, so a Tk-embedded figure keeps its own.
+    """
+    buf = io.BytesIO()
+    fig.savefig(buf, format='rgba', dpi=fig.dpi)
+    width, height = (int(v) for v in fig.bbox.size) # Same truncation Agg uses for its buffer
+    return np.frombuffer(buf.getbuffer(), dtype=np.uint8).reshape(height, width, 4).copy()
+
+
+def _get_analysis_figure(df, disease_name, target_col_name, source_info):
+    """Returns the analysis figure from the cache, building (and caching) it on a miss."""
+    required_cols = ['date', target_col_name, f"{target_col_name}_7d_avg", 'growth_rate', 'month']
+    if df is None or df.empty or any(col not in df.columns for col in required_cols):
+        # Nothing sensible to fingerprint; let the builder report the problem
+        return _build_analysis_charts(df, disease_name, target_col_name, source_info)
+
+    try:
+        cache_key = (disease_name, target_col_name, source_info, _df_fingerprint(df, required_cols))
+    except Exception as e:
+        print(f"[Analysis Plot] Warning: Could not fingerprint data, skipping figure cache: {e}")
+        return _build_analysis_charts(df, disease_name, target_col_name, source_info)
+
+    cached_fig = _figure_cache.get(cache_key)
+    if cached_fig is not None:
+        _figure_cache.move_to_end(cache_key) # Mark as most recently used
+        print(f"[Analysis Plot] Reusing cached figure for {target_col_name.capitalize()}.")
+        return cached_fig
+
+    fig = _build_analysis_charts(df, disease_name, target_col_name, source_info)
+    if fig is not None and fig.get_label() != _ERROR_FIGURE_LABEL: # Retrying the same selection should rebuild
+        _figure_cache[cache_key] = fig
+        while len(_figure_cache) > config.ANALYSIS_FIGURE_CACHE_SIZE:
+            _, evicted_fig = _figure_cache.popitem(last=False) # Evict least recently used
+            _recycle_figure(evicted_fig)
+    return fig
+
+
+def _recycle_figure(fig):
+    """Keeps an evicted figure as the spare for the next build (the previous spare is simply dropped)."""
+    global _spare_figure
+    _spare_figure = fig
+
+
+def _new_analysis_axes():
+    """Returns (fig, axes) for the 3-panel layout, clearing the spare figure when one is available."""
+    global _spare_figure
+    fig, _spare_figure = _spare_figure, None
+    subplot_kw = dict(sharex=False, gridspec_kw={'height_ratios': [2.2, 1, 1.1]})
+    if fig is None:
+        fig = Figure(figsize=(10, 9), dpi=100) # Not registered with pyplot: freed once unreferenced
+        return fig, fig.subplots(3, 1, **subplot_kw)
+    # Detach from its old Tk canvas first: that canvas and toolbar were destroyed when another
+    # figure was embedded, and clear() would call the dead toolbar
+    FigureCanvasBase(fig)
+    fig.clear()
+    fig.set_dpi(100)
+    fig.set_size_inches(10, 9) # An embedded canvas may have resized it
+    return fig, fig.subplots(3, 1, **subplot_kw)
+
+
+def clear_figure_cache():
+    """Drops all cached analysis figures (call on the main thread when the underlying data is reloaded)."""
+    _figure_cache.clear() # The spare figure holds no data and is kept for the next build
+
+
+def _numeric(series):
+    """
+    Returns the series as numbers, coercing invalid entries to NaN.
+    Processed columns are already numeric, so they are returned as-is without another full pass.
+    """
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series
+    return pd.to_numeric(series, errors='coerce')
+
+
+def _add_bar_collection(ax, dates, heights, width, **kwargs):
+    """
+    Draws date-positioned bars as a single PolyCollection instead of one
+    Rectangle artist per bar (same geometry as ax.bar with align='center').
+    """
+    x = mdates.date2num(dates)
+    heights = np.asarray(heights, dtype=float)
+    finite = np.isfinite(x) & np.isfinite(heights)
+    x, heights = x[finite], heights[finite]
+    left, right = x - width / 2, x + width / 2
+    zeros = np.zeros_like(heights)
+    # (N, 4, 2) vertices: bottom-left, top-left, top-right, bottom-right
+    verts = np.stack([
+        np.column_stack([left, zeros]), np.column_stack([left, heights]),
+        np.column_stack([right, heights]), np.column_stack([right, zeros]),
+    ], axis=1)
+    bars = PolyCollection(verts, **kwargs)
+    ax.xaxis_date() # Collections don't register date units on their own
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    return bars
+
+
+def _add_step_fill(ax, dates, heights, **kwargs):
+    """
+    Draws a contiguous daily series as one filled ax.stairs Path (2 vertices per
+    sample instead of 4). Step edges sit halfway between neighbouring dates.
+    """
+    x = mdates.date2num(dates)
+    heights = np.asarray(heights, dtype=float)
+    finite = np.isfinite(x)
+    x, heights = x[finite], np.nan_to_num(heights[finite]) # Missing values drawn at 0
+    if x.size == 0:
+        return None
+    half_step = (x[1] - x[0]) / 2 if x.size > 1 else 0.5
+    edges = np.concatenate([[x[0] - half_step], (x[:-1] + x[1:]) / 2, [x[-1] + half_step]])
+    ax.xaxis_date() # Raw date numbers carry no unit information
+    return ax.stairs(heights, edges, fill=True, baseline=0, **kwargs)
+
+
+def _quantiles(arr, qs):
+    """
+    Linear-interpolated quantiles (same as Series.quantile) from a single np.partition
+    call instead of one sort/selection per quantile. arr must be non-empty and NaN-free.
+    """
+    n = len(arr)
+    positions = [q * (n - 1) for q in qs]
+    kth = sorted({min(int(p) + step, n - 1) for p in positions for step in (0, 1)})
+    part = np.partition(arr, kth)
+    results = []
+    for p in positions:
+        lo = int(p)
+        hi = min(lo + 1, n - 1)
+        results.append(part[lo] + (part[hi] - part[lo]) * (p - lo))
+    return results
+
+
+def _decimation_indices(fig, n):
+    """
+    Returns evenly spaced row positions (first and last kept) when n exceeds two samples
+    per horizontal pixel of the figure, else None. Sub-pixel bars can't be told apart,
+    so only the drawn series are thinned; limits and stats still use every row.
+    """
+    target_n = 2 * int(fig.get_size_inches()[0] * fig.dpi)
+    if n <= target_n:
+        return None
+    return np.linspace(0, n - 1, target_n, dtype=np.int64)
+
+
+def _build_analysis_charts(df, disease_name, target_col_name, source_info=""):
     """
     Generates the 3-panel analysis plot (dark theme) for the specified target column.
     1. Daily Target Value (Bar) + 7-Day Avg (Line)
@@ -26,42 +248,48 @@ def plot_analysis_charts(df, disease_name, target_col_name, source_info=""):
     Returns:
         matplotlib.figure.Figure: The generated figure object, or None if error.
     """
-    target_type_label = target_col_name.capitalize() # "Cases" or "Deaths"
+    spec = _target_spec(target_col_name)
+    target_type_label = spec["label"] # "Cases" or "Deaths"
     print(f"[Analysis Plot] Generating 3-panel analysis charts for {target_type_label} (Dark Theme)...")
 
     # Determine required columns based on target
-    avg_col_name = f"{target_col_name}_7d_avg"
+    avg_col_name = spec["avg_col"]
     required_cols = ['date', target_col_name, avg_col_name, 'growth_rate', 'month']
 
     if df is None or df.empty:
         print("[Analysis Plot] Error: Input DataFrame is empty.")
         return None
 
-    # Convert date early and handle potential errors
+    # Convert date early and handle potential errors (rebinds df locally, the caller's frame is never mutated)
     try:
         if 'date' not in df.columns:
              raise ValueError("Missing required column: 'date'")
+        dates = df['date']
+        dates_converted = False
         # Ensure 'date' column is suitable for conversion before attempting
-        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+        if not pd.api.types.is_datetime64_any_dtype(dates):
             # Check if it looks like a date string before conversion
-            if pd.api.types.is_string_dtype(df['date']) or pd.api.types.is_object_dtype(df['date']):
-                 df['date'] = pd.to_datetime(df['date'], errors='coerce')
-                 if df['date'].isnull().any():
-                      print("[Analysis Plot] Warning: Some dates failed to convert. Check date format.")
-                      # Optionally drop rows with NaT dates if necessary: df.dropna(subset=['date'], inplace=True)
+            if pd.api.types.is_string_dtype(dates) or pd.api.types.is_object_dtype(dates):
+                 dates = pd.to_datetime(dates, errors='coerce', cache=True) # cache dedups repeated strings
+                 dates_converted = True
                  print("[Analysis Plot] Converted 'date' column to datetime early.")
             else:
                  # If it's numeric or other non-string/object type, conversion is unlikely to work
                  raise TypeError("Date column has an unexpected non-datetime, non-string type.")
-        # Drop rows with NaT dates if conversion failed for some
-        df.dropna(subset=['date'], inplace=True)
+        # Single NaT scan: drop rows whose date is missing or failed to convert
+        valid_dates = dates.notna()
+        if not valid_dates.all():
+            print("[Analysis Plot] Warning: Some dates are missing or failed to convert. Dropping those rows.")
+            df = df.loc[valid_dates].assign(date=dates[valid_dates])
+        elif dates_converted:
+            df = df.assign(date=dates)
         if df.empty:
              print("[Analysis Plot] Error: DataFrame empty after handling date conversion/dropping NaTs.")
              return None
 
     except Exception as e:
         print(f"[Analysis Plot] Error preparing date column: {e}")
-        traceback.print_exc()
+        if config.DEBUG_TRACEBACKS: traceback.print_exc() # Message above is enough by default
         return None # Cannot proceed without valid dates
 
     missing = [col for col in required_cols if col not in df.columns]
@@ -78,31 +306,19 @@ def plot_analysis_charts(df, disease_name, target_col_name, source_info=""):
     fig = None # Initialize fig
     try:
         # Style is set globally in config.py now
-        fig, axes = plt.subplots(
-            3, 1, figsize=(10, 9), dpi=100,
-            sharex=False,
-            gridspec_kw={'height_ratios': [2.2, 1, 1.1]}
-        )
+        fig, axes = _new_analysis_axes()
         fig.subplots_adjust(hspace=0.65, bottom=0.12, top=0.92)
 
         ax1, ax2, ax3 = axes # Unpack axes
+        # Daily and growth panels cover the same dates: share the x-axis so one date ticker serves both
+        ax2.sharex(ax1)
 
         # Colors from config and title setup based on target
-        colors = config.PLOT_COLORS_DARK
-        if target_col_name == 'cases':
-            bar_color = colors["daily_cases"]
-            avg_color = colors["avg_line_cases"]
-        elif target_col_name == 'deaths':
-            bar_color = colors["daily_deaths"]
-            avg_color = colors["avg_line_deaths"]
-        else: # Fallback
-            bar_color = "#CCCCCC"
-            avg_color = "#999999"
-
-        positive_growth_color = colors["positive_growth"]
-        negative_growth_color = colors["negative_growth"]
-        monthly_color = colors["monthly_avg"]
-        text_color = plt.rcParams['text.color']
+        bar_color, avg_color = spec["bar_color"], spec["avg_color"]
+        positive_growth_color = _COLORS["positive_growth"]
+        negative_growth_color = _COLORS["negative_growth"]
+        monthly_color = _COLORS["monthly_avg"]
+        text_color = _TEXT_COLOR
 
         # Dynamic Title based on Target
         title = f'{disease_name} - {target_type_label} Analysis{source_info}'
@@ -129,69 +345,87 @@ def plot_analysis_charts(df, disease_name, target_col_name, source_info=""):
 
         print(f"[Analysis Plot] X-axis limits set: {xmin_limit_date.date()} to {xmax_limit_date.date()}")
 
+        # Numeric view of the target, shared by Plot 1 and Plot 3
+        target_values = _numeric(df[target_col_name])
+
+        # Rows actually drawn in Plots 1 and 2 (None = all)
+        plot_rows = _decimation_indices(fig, len(df))
+        dates_arr = df['date'].to_numpy()
+        plot_dates = dates_arr if plot_rows is None else dates_arr[plot_rows]
+        if plot_rows is not None:
+            print(f"[Analysis Plot] Drawing {len(plot_rows)} of {len(df)} rows in the daily panels.")
+
         # --- Plot 1: Daily Target Value (Bar) & 7-Day Avg (Line) ---
         if target_col_name in df.columns and not df[target_col_name].isnull().all():
-            # Calculate dynamic bar width based on date frequency
-            date_diffs = df['date'].diff().dt.days.fillna(1).median() # Use median day difference
+            # Calculate dynamic bar width based on date frequency (average spacing of the sorted dates)
+            n_rows = len(df)
+            span_days = (df['date'].iloc[-1] - df['date'].iloc[0]).days if n_rows > 1 else 1
+            date_diffs = span_days / max(n_rows - 1, 1) # Average day difference
             bar_width = max(0.5, min(1.0, date_diffs * 0.7)) # Adjust multiplier as needed
 
-            ax1.bar(df['date'], df[target_col_name], color=bar_color, width=bar_width, alpha=0.7, label=f'Daily {target_type_label}')
+            plot_target = target_values.to_numpy(dtype='float64', na_value=np.nan)
+            _add_step_fill(ax1, plot_dates, plot_target if plot_rows is None else plot_target[plot_rows],
+                           color=bar_color, alpha=0.7, label=spec["daily_label"])
             if avg_col_name in df.columns:
-                ax1.plot(df['date'], df[avg_col_name], color=avg_color, linewidth=2.5, label='7-Day Avg')
+                plot_avg = df[avg_col_name].to_numpy()
+                ax1.plot(plot_dates, plot_avg if plot_rows is None else plot_avg[plot_rows],
+                         color=avg_color, linewidth=2.5, label='7-Day Avg')
             else:
                  print(f"[Analysis Plot] Warning: Average column '{avg_col_name}' not found for plot 1.")
 
-            ax1.set_title(f'Daily {target_type_label} and 7-Day Average', fontsize=11, weight='semibold')
-            ax1.set_ylabel(f'Number of {target_type_label}', fontsize=9)
+            ax1.set_title(spec["daily_title"], fontsize=11, weight='semibold')
+            ax1.set_ylabel(spec["daily_ylabel"], fontsize=9)
             ax1.legend(fontsize=8)
-            ax1.tick_params(axis='x', labelsize=8, rotation=15)
-            ax1.tick_params(axis='y', labelsize=8)
+            ax1.tick_params(labelsize=8)
+            ax1.tick_params(axis='x', rotation=15)
             ax1.grid(True, linestyle='--', alpha=0.4)
 
             # Robust calculation of Y limits for the target column
-            numeric_target = pd.to_numeric(df[target_col_name], errors='coerce').dropna()
+            numeric_target = target_values.dropna()
             if not numeric_target.empty:
                 min_y1 = numeric_target.min()
                 max_y1 = numeric_target.max()
                 # Ensure non-negative lower limit, add padding, handle zero max
-                ax1.set_ylim(bottom=max(0, min_y1 * 0.95 if min_y1 > 0 else 0),
-                             top=max(max_y1 * 1.05 if max_y1 > 0 else 10, 10)) # Min top limit of 10
+                y1_limits = (max(0, min_y1 * 0.95 if min_y1 > 0 else 0),
+                             max(max_y1 * 1.05 if max_y1 > 0 else 10, 10)) # Min top limit of 10
             else:
-                 ax1.set_ylim(bottom=0, top=10) # Fallback
+                 y1_limits = (0, 10) # Fallback
 
-            ax1.set_xlim(left=xmin_limit_date, right=xmax_limit_date) # Apply X limit
+            # Apply Y and X limits in one call (ax2 shares the X limits)
+            ax1.set(ylim=y1_limits, xlim=(xmin_limit_date, xmax_limit_date))
         else:
              ax1.text(0.5, 0.5, f"{target_type_label}/Date data unavailable", ha='center', va='center', transform=ax1.transAxes, color=text_color)
-             ax1.set_ylim(0, 10); ax1.set_xlim(left=xmin_limit_date, right=xmax_limit_date)
+             ax1.set(ylim=(0, 10), xlim=(xmin_limit_date, xmax_limit_date))
 
         # --- Plot 2: Daily Growth Rate (Color-coded Bars) ---
         # Growth rate calculation should be based on the primary target (handled in common_post_processing)
         if 'growth_rate' in df.columns:
             # Ensure growth_rate is numeric, handle potential inf/-inf/NaN
-            growth_data = pd.to_numeric(df['growth_rate'], errors='coerce').replace([np.inf, -np.inf], 0).fillna(0)
+            growth_data = _numeric(df['growth_rate']).replace([np.inf, -np.inf], 0).fillna(0)
 
             if not growth_data.empty and not growth_data.isnull().all():
-                positive_mask = growth_data > 0
-                # Use valid indices from the mask for date slicing
-                valid_pos_dates = df.loc[positive_mask[positive_mask].index, 'date']
-                valid_neg_dates = df.loc[positive_mask[~positive_mask].index, 'date']
-
-                ax2.bar(valid_pos_dates, growth_data[positive_mask],
-                        color=positive_growth_color, width=bar_width, alpha=0.8, label='Positive Growth')
-                ax2.bar(valid_neg_dates, growth_data[~positive_mask],
-                        color=negative_growth_color, width=bar_width, alpha=0.8, label='Negative/Zero Growth')
-
-                ax2.axhline(y=0, color=plt.rcParams['axes.edgecolor'], linestyle='-', linewidth=0.5)
-                ax2.set_title(f'Daily {target_type_label} Growth Rate (%)', fontsize=11, weight='semibold') # Dynamic title
+                # Split by sign on the raw arrays (row-aligned with df) to avoid .loc reindexing
+                growth_arr = growth_data.to_numpy()
+                if plot_rows is not None:
+                    growth_arr = growth_arr[plot_rows]
+                pos = growth_arr > 0
+
+                _add_bar_collection(ax2, plot_dates[pos], growth_arr[pos], bar_width,
+                                    facecolors=positive_growth_color, edgecolors='none', alpha=0.8, label='Positive Growth')
+                _add_bar_collection(ax2, plot_dates[~pos], growth_arr[~pos], bar_width,
+                                    facecolors=negative_growth_color, edgecolors='none', alpha=0.8, label='Negative/Zero Growth')
+
+                ax2.axhline(y=0, color=_EDGE_COLOR, linestyle='-', linewidth=0.5)
+                ax2.set_title(spec["growth_title"], fontsize=11, weight='semibold') # Dynamic title
                 ax2.set_ylabel('Growth (%)', fontsize=9)
-                ax2.tick_params(axis='x', labelsize=8, rotation=15)
-                ax2.tick_params(axis='y', labelsize=8)
+                ax2.tick_params(labelsize=8)
+                ax2.tick_params(axis='x', rotation=15)
                 ax2.grid(True, linestyle='--', alpha=0.4)
 
                 # Calculate robust Y limits using quantiles on valid numeric growth data
                 numeric_growth = growth_data.dropna() # Already handled inf/nan above
                 if not numeric_growth.empty:
-                    q05 = numeric_growth.quantile(0.05); q95 = numeric_growth.quantile(0.95)
+                    q05, q95 = _quantiles(numeric_growth.to_numpy(dtype='float64'), (0.05, 0.95))
                     # Avoid issues if all values are the same
                     if q05 == q95:
                         lim_bottom = q05 - 5
@@ -208,44 +442,40 @@ def plot_analysis_charts(df, disease_name, target_col_name, source_info=""):
                     ax2.set_ylim(bottom=lim_bottom, top=lim_top)
                 else:
                      ax2.set_ylim(-10, 10) # Default if no valid growth data
-
-                ax2.set_xlim(left=xmin_limit_date, right=xmax_limit_date) # Apply X limit
             else:
                  ax2.text(0.5, 0.5, "Growth rate data unavailable/invalid", ha='center', va='center', transform=ax2.transAxes, color=text_color)
-                 ax2.set_ylim(-10, 10); ax2.set_xlim(left=xmin_limit_date, right=xmax_limit_date)
+                 ax2.set_ylim(-10, 10) # X limits come from the shared ax1
         else:
              ax2.text(0.5, 0.5, "Growth rate column missing", ha='center', va='center', transform=ax2.transAxes, color=text_color)
-             ax2.set_ylim(-10, 10); ax2.set_xlim(left=xmin_limit_date, right=xmax_limit_date)
+             ax2.set_ylim(-10, 10) # X limits come from the shared ax1
 
         # --- Plot 3: Monthly Average Target Value (Bar) ---
         if 'month' in df.columns and target_col_name in df.columns:
-             # Create a copy to avoid modifying the original df slice
-             monthly_data = df[['month', target_col_name]].copy()
              # Ensure month is numeric (should be int after processing, but check)
-             monthly_data['month'] = pd.to_numeric(monthly_data['month'], errors='coerce')
-             monthly_data.dropna(subset=['month'], inplace=True)
+             month_arr = _numeric(df['month']).to_numpy(dtype=float, na_value=np.nan)
+             valid_month = np.isfinite(month_arr)
 
-             if not monthly_data.empty:
-                monthly_data['month'] = monthly_data['month'].astype(int)
+             if valid_month.any():
                 # Ensure target column is numeric for aggregation
-                numeric_monthly_target = pd.to_numeric(monthly_data[target_col_name], errors='coerce')
-                monthly_data[target_col_name] = numeric_monthly_target # Assign back potentially coerced data
-                monthly_data.dropna(subset=[target_col_name], inplace=True) # Drop rows where target became NaN
-
-                if not monthly_data.empty:
-                    # Group by month and calculate the mean of the target column
-                    monthly_avg = monthly_data.groupby('month')[target_col_name].mean()
-                    # Reindex to ensure all 12 months are present, fill missing with 0
-                    monthly_avg = monthly_avg[monthly_avg.index.isin(range(1,13))].reindex(range(1, 13), fill_value=0)
-
-                    if not monthly_avg.empty:
-                        months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-                        ax3.bar(monthly_avg.index, monthly_avg.values, color=monthly_color, alpha=0.8)
-                        ax3.set_title(f'Average Daily {target_type_label} per Month', fontsize=11, weight='semibold') # Dynamic title
-                        ax3.set_ylabel(f'Avg {target_type_label}', fontsize=9) # Dynamic label
-                        ax3.set_xticks(range(1, 13)); ax3.set_xticklabels(months, rotation=45, ha="right")
-                        ax3.tick_params(axis='x', labelsize=8)
-                        ax3.tick_params(axis='y', labelsize=8)
+                value_arr = target_values.to_numpy(dtype=float, na_value=np.nan)
+                valid = valid_month & np.isfinite(value_arr)
+
+                if valid.any():
+                    # Per-month mean as two bincount passes (sums / counts); months outside 1-12 are ignored
+                    month_idx = month_arr[valid].astype(np.int64)
+                    in_range = (month_idx >= 1) & (month_idx <= 12)
+                    month_idx = month_idx[in_range]
+                    sums = np.bincount(month_idx, weights=value_arr[valid][in_range], minlength=13)[1:13]
+                    counts = np.bincount(month_idx, minlength=13)[1:13]
+                    # Months without data are shown as 0
+                    monthly_avg = np.divide(sums, counts, out=np.zeros(12), where=counts > 0)
+
+                    if counts.any():
+                        ax3.bar(range(1, 13), monthly_avg, color=monthly_color, alpha=0.8)
+                        ax3.set_title(spec["monthly_title"], fontsize=11, weight='semibold') # Dynamic title
+                        ax3.set_ylabel(spec["monthly_ylabel"], fontsize=9) # Dynamic label
+                        ax3.set_xticks(range(1, 13)); ax3.set_xticklabels(_MONTH_LABELS, rotation=45, ha="right")
+                        ax3.tick_params(labelsize=8)
                         ax3.grid(True, axis='y', linestyle='--', alpha=0.4)
                         # Calculate Y limits based on monthly averages
                         max_y3 = monthly_avg.max()
@@ -264,26 +494,27 @@ def plot_analysis_charts(df, disease_name, target_col_name, source_info=""):
              ax3.set_ylim(0, 10)
 
         # --- Auto-format Date Ticks for limited range ---
-        for ax in [ax1, ax2]:
-             try: # Add try-except around locator/formatter in case limits cause issues
-                 locator = mdates.AutoDateLocator(minticks=4, maxticks=10) # Allow slightly more ticks
-                 formatter = mdates.ConciseDateFormatter(locator)
-                 ax.xaxis.set_major_locator(locator)
-                 ax.xaxis.set_major_formatter(formatter)
-             except Exception as e:
-                  print(f"[Analysis Plot] Warning: Failed to apply auto date ticks: {e}")
-                  # Fallback: Just rotate existing labels if formatter fails
-                  plt.setp(ax.get_xticklabels(), rotation=30, ha='right')
+        # ax2 shares ax1's x-axis ticker, so a single locator/formatter pair covers both panels
+        try: # Add try-except around locator/formatter in case limits cause issues
+            locator = mdates.AutoDateLocator(minticks=4, maxticks=10) # Allow slightly more ticks
+            ax1.xaxis.set_major_locator(locator)
+            ax1.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+        except Exception as e:
+            print(f"[Analysis Plot] Warning: Failed to apply auto date ticks: {e}")
+            # Fallback: Just rotate existing labels if formatter fails
+            for ax in (ax1, ax2):
+                setp(ax.get_xticklabels(), rotation=30, ha='right')
 
         return fig
 
     except Exception as e:
         print(f"[Analysis Plot] Error during plotting for {target_type_label}: {e}")
-        traceback.print_exc()
-        if fig: plt.close(fig)
+        if config.DEBUG_TRACEBACKS: traceback.print_exc() # Message above is enough by default
         # Return error figure (using config colors)
-        fig_err, ax_err = plt.subplots(figsize=(10, 7))
-        error_color = config.PLOT_COLORS_DARK.get('negative_growth', '#FF0000') # Use config color or default red
+        fig_err = Figure(figsize=(10, 7))
+        fig_err.set_label(_ERROR_FIGURE_LABEL)
+        ax_err = fig_err.subplots()
+        error_color = _COLORS.get('negative_growth', '#FF0000') # Use config color or default red
         fig_err.patch.set_facecolor(config.DARK_PLOT_STYLE.get("figure.facecolor", "#000000")) # Set fig background
         ax_err.set_facecolor(config.DARK_PLOT_STYLE.get("axes.facecolor", "#000000")) # Set axes background
         ax_err.text(0.5, 0.5, f"Error generating analysis plot for {target_type_label}:\n{e}",
@@ -309,25 +540,21 @@ def calculate_analysis_stats(df, target_col_name):
             print(f"[Analysis Stats] Target column '{target_col_name}' missing or all NaN.")
             return {"error": f"{target_type_label} data missing"}
 
-        # Convert target column to numeric robustly for calculations
-        numeric_target = pd.to_numeric(df[target_col_name], errors='coerce').dropna()
-        if numeric_target.empty:
+        # Convert target column to numeric robustly for calculations (NaN marks invalid entries)
+        target_arr = _numeric(df[target_col_name]).to_numpy(dtype='float64', na_value=np.nan)
+        valid_target = ~np.isnan(target_arr)
+        if not valid_target.any():
              print(f"[Analysis Stats] No valid numeric '{target_col_name}' data found.")
              return {"error": f"No valid {target_type_label} data"}
 
-        # Raw calculations based on the target column
-        raw_total = numeric_target.sum()
-        raw_avg = numeric_target.mean()
-        raw_max = numeric_target.max()
+        # Raw calculations based on the target column, straight on the NumPy buffer
+        peak_pos = int(np.nanargmax(target_arr)) # Row position of the (first) maximum
+        raw_total = np.nansum(target_arr)
+        raw_avg = np.nanmean(target_arr)
+        raw_max = target_arr[peak_pos]
         raw_peak_date = None
-        # Find peak date using the original index on the numeric target data
-        if 'date' in df and not numeric_target.empty:
-            try:
-                max_numeric_idx = numeric_target.idxmax() # Get index from the filtered numeric series
-                if pd.notna(max_numeric_idx) and max_numeric_idx in df.index: # Check if index exists in original df
-                    raw_peak_date = df.loc[max_numeric_idx, 'date']
-            except ValueError: pass # idxmax raises ValueError if data is all NaN (already handled)
-            except KeyError: pass # Handle if index somehow doesn't align
+        if 'date' in df:
+            raw_peak_date = df['date'].iloc[peak_pos] # Positional lookup, no index alignment needed
 
         stats_values["raw_total"] = raw_total
         stats_values["raw_avg"] = raw_avg
@@ -338,10 +565,11 @@ def calculate_analysis_stats(df, target_col_name):
         stats_values["risk_level"] = "Medium"; stats_values["trend_desc"] = "Stable"
         if 'growth_rate' in df and not df['growth_rate'].isnull().all() and len(df) >= 7:
             # Calculate mean growth over the last 7 days robustly
-            recent_growth_numeric = pd.to_numeric(df['growth_rate'].iloc[-7:], errors='coerce').dropna()
-            if not recent_growth_numeric.empty:
-                recent_growth = recent_growth_numeric.mean()
-                if pd.notna(recent_growth):
+            growth_tail = _numeric(df['growth_rate'].iloc[-7:]).to_numpy(dtype='float64', na_value=np.nan)
+            growth_tail = growth_tail[~np.isnan(growth_tail)]
+            if growth_tail.size:
+                recent_growth = growth_tail.mean()
+                if not np.isnan(recent_growth):
                     # Define thresholds for risk/trend (can be adjusted)
                     if recent_growth > 5: stats_values["risk_level"] = "High"; stats_values["trend_desc"] = "↗️ Increasing"
                     elif recent_growth < -5: stats_values["risk_level"] = "Low"; stats_values["trend_desc"] = "↘️ Decreasing"
@@ -371,5 +599,5 @@ def calculate_analysis_stats(df, target_col_name):
         return stats_values
     except Exception as e:
         print(f"Error calculating analysis statistics for {target_type_label}: {e}")
-        traceback.print_exc()
+        if config.DEBUG_TRACEBACKS: traceback.print_exc() # Message above is enough by default
         return {"error": f"Could not calculate {target_type_label} stats"}
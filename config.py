@@ -2,7 +2,8 @@
 """Configuration constants for the Disease Tracker application."""
 
 import os
-import matplotlib.pyplot as plt # Needed for defining style
+import matplotlib
+import matplotlib.style # Needed for defining style
 
 # ... (other UI config) ...
 PLACEHOLDER_COLOR = "#6A5C94"
@@ -69,8 +70,19 @@ ALLOWED_ZIKA_COUNTRIES = [
     'Saudi Arabia', 'Algeria', 'Morocco'
 ]
 
+# --- Diagnostics ---
+DEBUG_TRACEBACKS = os.environ.get("EPIFORECAST_DEBUG") == "1" # Full tracebacks for handled plot/stat errors
+
+# --- Loading & In-Memory Caches ---
+PREFETCH_RAW_DATA = True # Load all real-data files in background threads at start-up
+PROCESSED_MEMO_SIZE = 64 # In-memory processed frames kept per (disease, country, target)
+
+# --- Export ---
+EXPORT_WORKERS = min(8, os.cpu_count() or 1) # Countries preprocessed concurrently by 'Export Cleaned'
+
 # --- Plotting ---
 HISTORICAL_CONTEXT_DAYS = 120
+ANALYSIS_FIGURE_CACHE_SIZE = 16 # Max analysis figures kept for re-display
 DARK_PLOT_STYLE = {
     "figure.facecolor": "#261758", "axes.facecolor": "#261758",
     "axes.edgecolor": "#8A7CB4", "axes.labelcolor": "#8A7CB4",
@@ -79,8 +91,8 @@ DARK_PLOT_STYLE = {
     "text.color": "#FFFFFF", "legend.facecolor": "#261758",
     "legend.edgecolor": "#8A7CB4", "legend.labelcolor": "#FFFFFF"
 }
-plt.style.use('dark_background')
-plt.rcParams.update(DARK_PLOT_STYLE)
+matplotlib.style.use('dark_background')
+matplotlib.rcParams.update(DARK_PLOT_STYLE)
 
 PLOT_COLORS_DARK = {
     # Cases Colors
@@ -112,9 +124,13 @@ WINDOW_GEOMETRY = "1450x900"
 AVAILABLE_DISEASES = [
     "COVID-19", "Grippe", "Zika", # Added Zika disease
 ]
+AVAILABLE_DISEASES_SET = frozenset(AVAILABLE_DISEASES) # For membership checks
 # Options for the target selector Combobox
 ANALYSIS_TARGETS = ["Cases", "Deaths"]
+ANALYSIS_TARGETS_SET = frozenset(ANALYSIS_TARGETS) # For membership checks
 DEFAULT_ANALYSIS_TARGET = "Cases"
+SELECTION_DEBOUNCE_MS = 150 # Only the last combobox change within this window is handled
+STATUS_POLL_MS = 100 # How often worker-thread progress messages are applied to the status bar
 
 # --- Modeling ---
 PREDICTION_FEATURE_COLS = ['day_of_year', 'month', 'day', 'day_of_week']
@@ -1,14 +1,120 @@
 # data_loader.py
 """Functions for loading disease data from various sources."""
 
-import math
+import codecs
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 import os
 import config  # Import configuration
 import traceback # Import traceback
 
+# pyarrow is optional: when installed, pandas can parse CSVs with its multi-threaded reader
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def _restrict_to_header(file_path, encoding, usecols, dtype):
+    """Drops usecols/dtype entries for columns missing from the file header."""
+    header = pd.read_csv(file_path, encoding=encoding, nrows=0).columns
+    if usecols is not None:
+        wanted = set(usecols)
+        usecols = [col for col in header if col in wanted] or None # None of them: read all, let validation report
+    if dtype:
+        dtype = {col: typ for col, typ in dtype.items()
+                 if col in header and (usecols is None or col in usecols)}
+    return usecols, dtype
+
+
+def _read_csv(file_path, encoding=None, usecols=None, dtype=None, **c_engine_kwargs):
+    """
+    Reads a CSV with pandas' pyarrow engine when pyarrow is installed, otherwise
+    (or if pyarrow can't parse the file) with the default C engine.
+    usecols/dtype are restricted to the columns actually present in the header,
+    so optional columns can be listed safely. c_engine_kwargs are C-engine-only
+    options such as low_memory.
+    """
+    if usecols is not None or dtype:
+        usecols, dtype = _restrict_to_header(file_path, encoding, usecols, dtype)
+
+    if _HAS_PYARROW:
+        try:
+            return pd.read_csv(file_path, encoding=encoding, usecols=usecols, dtype=dtype, engine="pyarrow")
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            print(f"[CSV Reader] pyarrow engine failed for '{file_path}' ({e}), retrying with the C engine...")
+    # memory_map: parse straight from the mapped file (page cache) instead of read() copies
+    return pd.read_csv(file_path, encoding=encoding, usecols=usecols, dtype=dtype, memory_map=True, **c_engine_kwargs)
+
+
+def _downcast_counts(df, cols):
+    """
+    Stores integer count columns as int32 when their values fit (halving their memory).
+    Float columns are left alone: float32 can't hold large cumulative totals exactly.
+    """
+    int32_info = np.iinfo(np.int32)
+    for col in cols:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]) and df[col].dtype.itemsize > 4:
+            values = df[col]
+            if values.empty or (values.min() >= int32_info.min and values.max() <= int32_info.max):
+                df[col] = values.astype(np.int32)
+    return df
+
+
+def _parse_dates(df, date_col):
+    """
+    Converts date_col to datetime64 once for the whole frame, so per-country preprocessing
+    (whose pd.to_datetime is then a no-op) doesn't re-parse the same strings for every country
+    and target. Left as text if any value fails to parse, so preprocessing handles it as before.
+    """
+    if date_col not in df.columns or pd.api.types.is_datetime64_any_dtype(df[date_col]):
+        return df
+    try:
+        parsed = pd.to_datetime(df[date_col], errors='coerce')
+    except Exception as e:
+        print(f"[Loader] Note: '{date_col}' left as text ({e}).")
+        return df
+    if parsed.isna().sum() == df[date_col].isna().sum(): # Every present value parsed
+        df[date_col] = parsed
+    return df
+
+
+def _detect_encoding(file_path, candidates=('utf-8', 'latin1', 'cp1252'), sniff_bytes=65536):
+    """
+    Returns the first candidate encoding that decodes the head of the file, so the
+    CSV is parsed once instead of retrying full parses on UnicodeDecodeError.
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(sniff_bytes)
+    for encoding in candidates:
+        try:
+            # Incremental decode: a multi-byte character cut at the sniff boundary isn't an error
+            codecs.getincrementaldecoder(encoding)().decode(head, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return candidates[-1]
+
+
+def _read_raw(file_path, date_col=None, **read_kwargs):
+    """Parses the CSV (see _read_csv) and converts date_col once for the whole frame (see _parse_dates)."""
+    df = _read_csv(file_path, **read_kwargs)
+    return _parse_dates(df, date_col) if date_col else df
+
+
+# --- Required raw columns (checked after every load) ---
+_INFLUENZA_REQUIRED_COLS = (config.GRIPPE_RAW_COUNTRY_COL, config.GRIPPE_DATE_COL, config.GRIPPE_CASES_COL)
+_ZIKA_REQUIRED_COLS = (config.ZIKA_COUNTRY_COL, config.ZIKA_DATE_COL, config.ZIKA_CASES_COL, config.ZIKA_DEATHS_COL)
+
+
+def _missing_columns(df, required):
+    """Returns the required columns absent from df (one set difference), in their declared order."""
+    missing = set(required).difference(df.columns)
+    return [col for col in required if col in missing]
+
+
 # --- Specific Loaders ---
 
 def load_covid_raw_data( file_path=config.COVID_LOCAL_DATA_FILE ):
@@ -16,19 +122,23 @@ def load_covid_raw_data( file_path=config.COVID_LOCAL_DATA_FILE ):
     full_path = os.path.abspath(file_path)
     print(f"[COVID Loader] Attempting to load data from: {full_path}")
     try:
+        # Only the columns preprocessing can use; country names as compact categoricals
+        read_kwargs = dict(usecols=config.COVID_RELEVANT_COLUMNS, dtype={'country': 'category'})
+        encoding = _detect_encoding(file_path)
+        if encoding != 'utf-8':
+            print(f"[COVID Loader] UTF-8 failed, using {encoding} encoding...")
         try:
-            df = pd.read_csv(file_path, encoding='utf-8')
+            df = _read_raw(file_path, date_col='date', encoding=encoding, **read_kwargs)
         except UnicodeDecodeError:
-            try:
-                print("[COVID Loader] UTF-8 failed, trying latin1 encoding...")
-                df = pd.read_csv(file_path, encoding='latin1')
-            except UnicodeDecodeError:
-                print("[COVID Loader] latin1 failed, trying cp1252 encoding...")
-                df = pd.read_csv(file_path, encoding='cp1252')
-
-        if df.empty:
+            # Non-UTF-8 bytes beyond the sniffed head; latin1 decodes any byte
+            print("[COVID Loader] UTF-8 failed past the file head, trying latin1 encoding...")
+            df = _read_raw(file_path, date_col='date', encoding='latin1', **read_kwargs)
+        df = _downcast_counts(df, config.COVID_COLS_TO_FILL_ZERO)
+
+        shape = df.shape # (rows, columns), reused for the log line
+        if shape[0] == 0:
             raise ValueError(f"The file '{file_path}' is empty.")
-        print(f"[COVID Loader] Data loaded successfully. Shape: {df.shape}")
+        print(f"[COVID Loader] Data loaded successfully. Shape: {shape}")
 
         if 'country' not in df.columns:
             print("[COVID Loader] WARNING: 'country' column not found!")
@@ -55,17 +165,21 @@ def load_real_influenza_data(file_path=config.GRIPPE_DATA_SOURCE):
     full_path = os.path.abspath(file_path)
     print(f"[Influenza Loader] Attempting to load ALL Influenza data from: {full_path}")
     try:
-        # Handle potential mixed types warning if needed
-        df = pd.read_csv(file_path, low_memory=False)
+        # Only country/date/cases are used downstream; handle potential mixed types warning if needed
+        read_kwargs = dict(usecols=_INFLUENZA_REQUIRED_COLS,
+                           dtype={config.GRIPPE_RAW_COUNTRY_COL: 'category'})
+        df = _read_raw(file_path, date_col=config.GRIPPE_DATE_COL, low_memory=False, **read_kwargs)
+        df = _downcast_counts(df, [config.GRIPPE_CASES_COL])
 
-        if df.empty:
+        shape = df.shape # (rows, columns), reused for the log line
+        if shape[0] == 0:
             raise ValueError(f"The file '{file_path}' is empty.")
-        print(f"[Influenza Loader] Raw data loaded successfully. Shape: {df.shape}")
+        print(f"[Influenza Loader] Raw data loaded successfully. Shape: {shape}")
 
         # Check required raw columns exist GLOBALLY in the file
         # Note: GRIPPE_DEATHS_COL is None, so only cases are checked here
-        required_raw_cols = [config.GRIPPE_RAW_COUNTRY_COL, config.GRIPPE_DATE_COL, config.GRIPPE_CASES_COL]
-        missing_raw = [col for col in required_raw_cols if col not in df.columns]
+        required_raw_cols = list(_INFLUENZA_REQUIRED_COLS)
+        missing_raw = _missing_columns(df, required_raw_cols)
         if missing_raw:
             raise ValueError(f"Missing required columns in the raw influenza file: {missing_raw}. Found: {list(df.columns)}")
         print(f"[Influenza Loader] Essential raw columns ({required_raw_cols}) found.")
@@ -94,16 +208,21 @@ def load_zika_data(file_path=config.ZIKA_DATA_FILE):
     full_path = os.path.abspath(file_path)
     print(f"[Zika Loader] Attempting to load ALL Zika data from: {full_path}")
     try:
-        df = pd.read_csv(file_path)
+        # Required columns plus the optional enhanced ones; country names as compact categoricals
+        zika_cols = list(_ZIKA_REQUIRED_COLS)
+        zika_cols += [col for col in getattr(config, 'ZIKA_RELEVANT_COLUMNS', []) if col not in zika_cols]
+        read_kwargs = dict(usecols=zika_cols, dtype={config.ZIKA_COUNTRY_COL: 'category'})
+        df = _read_raw(file_path, date_col=config.ZIKA_DATE_COL, **read_kwargs)
+        df = _downcast_counts(df, [config.ZIKA_CASES_COL, config.ZIKA_DEATHS_COL])
 
-        if df.empty:
+        shape = df.shape # (rows, columns), reused for the log line
+        if shape[0] == 0:
             raise ValueError(f"The file '{file_path}' is empty.")
-        print(f"[Zika Loader] Raw data loaded successfully. Shape: {df.shape}")
+        print(f"[Zika Loader] Raw data loaded successfully. Shape: {shape}")
 
         # Check required columns exist in the file
-        required_raw_cols = [config.ZIKA_COUNTRY_COL, config.ZIKA_DATE_COL, 
-                            config.ZIKA_CASES_COL, config.ZIKA_DEATHS_COL]
-        missing_raw = [col for col in required_raw_cols if col not in df.columns]
+        required_raw_cols = list(_ZIKA_REQUIRED_COLS)
+        missing_raw = _missing_columns(df, required_raw_cols)
         if missing_raw:
             raise ValueError(f"Missing required columns in the Zika file: {missing_raw}. Found: {list(df.columns)}")
         print(f"[Zika Loader] Essential raw columns ({required_raw_cols}) found.")
@@ -131,38 +250,82 @@ def load_zika_data(file_path=config.ZIKA_DATA_FILE):
 def simulate_disease_data(disease_name):
     """Generates simulated data for demonstration (always represents 'cases')."""
     print(f"[SIM Loader] Simulating data for: {disease_name}")
-    today = datetime.now()
     # Generate more data points for better simulation display
     num_days_sim = 730 # Simulate 2 years
-    dates = [(today - timedelta(days=i)).strftime('%Y-%m-%d')
-             for i in range(num_days_sim, 0, -1)]
-    cases = []
-    np.random.seed(42) # Keep consistent simulation
+    # Daily dates (midnight) from num_days_sim days ago up to yesterday, built directly as datetimes
+    dates = pd.date_range(end=pd.Timestamp.today().normalize() - pd.Timedelta(days=1),
+                          periods=num_days_sim, freq='D')
+    rng = np.random.default_rng(42) # Keep consistent simulation
 
     # Use generic pattern for all simulations now, Grippe uses real data
     print(f"[SIM Loader] Using generic simulation pattern for {disease_name}.")
-    for i in range(num_days_sim):
-         date = datetime.strptime(dates[i], '%Y-%m-%d'); m = date.month
-         # Basic seasonality centered around mid-year (adjust as needed)
-         seasonal_factor = 1.0 + 0.8 * math.exp(-min((m - 7.5) % 12, (19.5 - m) % 12)**2 / 6)
-         base = np.random.uniform(50, 150) # Random base level
-         cyclic = 100 * seasonal_factor * np.sin(i / 90 + np.random.uniform(0, 6)) # Random phase/amplitude
-         noise = np.random.normal(0, 30 * seasonal_factor)
-         cases.append(int(base + cyclic + noise))
-
-    simulated_df = pd.DataFrame({
+    # Whole-series NumPy evaluation of the per-day formula
+    day_idx = np.arange(num_days_sim)
+    m = dates.month.to_numpy()
+    # Basic seasonality centered around mid-year (adjust as needed)
+    seasonal_factor = 1.0 + 0.8 * np.exp(-np.minimum((m - 7.5) % 12, (19.5 - m) % 12)**2 / 6)
+    base = rng.uniform(50, 150, num_days_sim) # Random base level
+    cyclic = 100 * seasonal_factor * np.sin(day_idx / 90 + rng.uniform(0, 6, num_days_sim)) # Random phase/amplitude
+    noise = rng.normal(0, 30 * seasonal_factor)
+    # Truncate like int(), ensure non-negative; int32 like the real loaders' counts
+    cases = np.maximum((base + cyclic + noise).astype(np.int32), 0)
+
+    # Frame built straight from the arrays (no copy); it already holds only 'date' and 'cases'
+    return pd.DataFrame({
         'date': dates,
-        config.PREDICTION_CASES_TARGET_COL: [max(0, c) for c in cases] # Ensure non-negative cases, use standard name
-    })
-    # Ensure 'date' column is datetime type
-    try:
-        simulated_df['date'] = pd.to_datetime(simulated_df['date'])
-    except Exception as e:
-        print(f"[SIM Loader] Error converting simulated date column: {e}")
-        return pd.DataFrame()
+        config.PREDICTION_CASES_TARGET_COL: cases # Use standard name
+    }, copy=False)
+
+# --- In-memory memoization ---
+@functools.lru_cache(maxsize=8)
+def _load_for_mtime(loader, file_path, mtime):
+    """lru_cache'd loader call; mtime is part of the key so an edited file is re-read."""
+    return loader(file_path)
+
+
+def _memoized_load(loader, file_path):
+    """
+    Returns loader(file_path), reusing the DataFrame from an earlier call while the file
+    is unchanged. The DataFrame is shared between callers: treat it as read-only.
+    Waits for a background prefetch of the same file instead of parsing it twice.
+    """
+    future = _prefetch_futures.pop(file_path, None)
+    if future is not None:
+        try:
+            future.result() # Its result is now in the lru_cache
+        except Exception:
+            pass # The call below re-raises the loader's error for this caller
+    return _load_current(loader, file_path)
+
+
+def _load_current(loader, file_path):
+    """Memoized load keyed by the file's current modification time."""
+    if not os.path.exists(file_path):
+        return loader(file_path) # Let the loader raise its own "not found" error
+    return _load_for_mtime(loader, file_path, os.path.getmtime(file_path))
+
+
+_prefetch_futures = {} # file path -> Future of a background load started by prefetch_all
+
+
+def prefetch_all():
+    """
+    Starts loading every real-data file that exists in background threads (CSV parsing
+    releases the GIL), so a later get_data_source call for it returns from memory.
+    Returns immediately.
+    """
+    sources = [(load_covid_raw_data, config.COVID_LOCAL_DATA_FILE),
+               (load_real_influenza_data, config.GRIPPE_DATA_SOURCE),
+               (load_zika_data, config.ZIKA_DATA_FILE)]
+    sources = [(loader, path) for loader, path in sources if os.path.exists(path)]
+    if not sources:
+        return
+    print(f"[Data Prefetch] Loading {len(sources)} data file(s) in the background...")
+    executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="data-prefetch")
+    for loader, path in sources:
+        _prefetch_futures[path] = executor.submit(_load_current, loader, path)
+    executor.shutdown(wait=False) # Workers finish their load, then exit
 
-    # Return only essential columns ('date' and 'cases')
-    return simulated_df[['date', config.PREDICTION_CASES_TARGET_COL]].copy()
 
 # --- Dispatcher (MODIFIED for Grippe) ---
 def get_data_source(disease_name):
@@ -171,12 +334,13 @@ def get_data_source(disease_name):
     Returns the raw DataFrame (or None if loading fails).
     For COVID & Grippe, returns the full raw DataFrame.
     For others, returns a DataFrame with 'date' and 'cases' (simulated).
+    Real-data frames are memoized per file modification time and shared (read-only).
     """
     print(f"[Data Dispatcher] Getting source for: {disease_name}")
     if disease_name == "COVID-19":
         try:
             # Returns the full raw COVID DataFrame
-            return load_covid_raw_data()
+            return _memoized_load(load_covid_raw_data, config.COVID_LOCAL_DATA_FILE)
         except Exception as e:
             print(f"[Data Dispatcher] Error loading COVID data: {e}")
             raise
@@ -184,7 +348,7 @@ def get_data_source(disease_name):
     elif disease_name == "Grippe":
         try:
             # Returns the full raw Influenza DataFrame
-            return load_real_influenza_data()
+            return _memoized_load(load_real_influenza_data, config.GRIPPE_DATA_SOURCE)
         except Exception as e:
             print(f"[Data Dispatcher] Error loading REAL Grippe data: {e}. Falling back to SIMULATION.")
             # Fallback returns DataFrame with 'date', 'cases'
@@ -193,7 +357,7 @@ def get_data_source(disease_name):
     elif disease_name == "Zika":
         try:
             # Returns the full raw Zika DataFrame
-            return load_zika_data()
+            return _memoized_load(load_zika_data, config.ZIKA_DATA_FILE)
         except Exception as e:
             print(f"[Data Dispatcher] Error loading REAL Zika data: {e}. Falling back to SIMULATION.")
             # Fallback returns DataFrame with 'date', 'cases'
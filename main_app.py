@@ -3,11 +3,16 @@
 import os
 import sys
 import threading
+import queue
 import traceback
 import math
+import contextlib
+import concurrent.futures
+from collections import OrderedDict
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('TkAgg') # Figures are plain matplotlib.figure.Figure objects embedded via FigureCanvasTkAgg (no pyplot)
 from matplotlib.backends.backend_tkagg import (
     FigureCanvasTkAgg,
     NavigationToolbar2Tk,
@@ -46,6 +51,16 @@ except ImportError as e:
     except Exception: pass
     sys.exit(1)
 
+_ALLOWED_COVID_SET = frozenset(config.ALLOWED_COVID_COUNTRIES) # O(1) filter for countries found in the COVID file
+
+
+def _distinct_countries(series):
+    """Sorted distinct country names; the loaders read country columns as categoricals,
+    so this walks the categories (one entry per country) instead of every row."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return sorted({str(c) for c in series.cat.categories}) # NaN is never a category
+    return sorted(series.dropna().astype(str).unique())
+
 
 # --- Main Application Class (Controller) ---
 class DarkThemedDiseaseApp:
@@ -95,6 +110,9 @@ class DarkThemedDiseaseApp:
         self.allowed_covid_countries_in_data = []
         self.allowed_influenza_countries_in_data = []
         self.allowed_zika_countries_in_data = []
+        self._valid_countries_set = set() # Union of the allowed_*_countries_in_data lists (see _refresh_valid_countries)
+        self._country_values_cache = {} # disease -> country combobox values tuple, cleared with _valid_countries_set
+        self._raw_country_index = {} # disease -> (raw frame, processing.country_row_index result)
         self.available_diseases = ["Select Disease"] + config.AVAILABLE_DISEASES # Add placeholder
         self.available_targets = config.ANALYSIS_TARGETS
 
@@ -113,12 +131,39 @@ class DarkThemedDiseaseApp:
         self.analyze_button = None
         self.export_all_button = None
         self.sidebar_buttons = {}
+        self._selected_sidebar = None # Name of the sidebar button currently shown as selected
+        self._focused_combobox = None # Header combobox holding keyboard focus (from FocusIn/FocusOut)
+        self._combobox_colors = {} # Last foreground applied per combobox
+        self._processed_stale = False # Target changed since disease_data was processed (see _do_target_change)
+        self._widget_state_cache = {} # widget -> options last applied by _apply_widget_options/_set_packed
+        self._ui_update_pending = None # after_idle id of a scheduled _update_ui_element_states refresh
+        self._widget_batch_depth = 0 # >0 while _apply_widget_options calls are being batched
+        self._pending_widget_options = {} # widget -> merged options waiting for the batch to end
+        self._last_ui_sig = None # _ui_inputs_signature() of the last successful control-state refresh
+        self._in_ui_refresh = False # True while _do_update_ui_element_states is writing control state
+        self._state_cache = {'disease': "Select Disease", 'country': "Select Country", # Refreshed by _update_ui_element_states
+                             'target': config.DEFAULT_ANALYSIS_TARGET, 'analyze_enabled': False}
         self.view_frames = {}
         self.canvas = None # For embedded plots
         self.toolbar = None # For embedded plots
+        self._embedded = {} # plot frame -> (figure, canvas, toolbar) last embedded there
         self.particle_bg = None # New particle background
         self.loading_indicator = None # New loading indicator
         self.theme_toggle = None # New theme toggle
+        self._ui_busy = False # Set by _set_ui_busy; pauses the background animation
+        self._bg_hidden = False # Window minimized/unmapped; pauses the background animation
+        self._pending_handler = {} # Debounced selection handlers: key -> (after() id, handler)
+        self._processed_cache = OrderedDict() # (disease, country, target) -> (raw frame, processed frame)
+        self._processed_cache_lock = threading.Lock()
+        self._load_jobs = queue.Queue() # (disease, cancel token) for the single loader thread
+        self._load_cancel = threading.Event() # Token of the most recent load request
+        threading.Thread(target=self._load_worker_loop, daemon=True, name="data-loader").start()
+        self._task_jobs = queue.Queue() # (func, args) for processing/prediction/export, run in order
+        threading.Thread(target=self._task_worker_loop, daemon=True, name="task-worker").start()
+        self._status_q = queue.Queue() # Progress messages from worker threads (see _post_status)
+        self._pending_notify = {} # field -> (value, widget value when queued), applied by _flush_notify
+        self._notify_job = None # after_idle id of the scheduled _flush_notify
+        self.root.after(config.STATUS_POLL_MS, self._drain_status_queue)
 
         # Create UI elements AFTER setting placeholders
         self.configure_style()
@@ -134,54 +179,64 @@ class DarkThemedDiseaseApp:
         self._update_ui_element_states() # Handles initial state & color of all controls
 
 
-    def configure_style(self):
-        self.style = ttk.Style()
-        self.style.theme_use('clam')
-
-        # --- General Styles ---
-        self.style.configure('.', background=self.colors["bg_dark"], foreground=self.colors["text_primary"], bordercolor=self.colors["bg_card"], font=('Segoe UI', 10))
-        self.style.configure('TFrame', background=self.colors["bg_dark"])
-        self.style.configure('Card.TFrame', background=self.colors["bg_card"])
-        self.style.configure('TLabel', background=self.colors["bg_dark"], foreground=self.colors["text_primary"])
-        self.style.configure('Secondary.TLabel', foreground=self.colors["text_secondary"])
-        self.style.configure('Card.TLabel', background=self.colors["bg_card"], foreground=self.colors["text_primary"])
-        self.style.configure('Horizontal.TScale', background=self.colors["bg_card"], troughcolor=self.colors["bg_dark"], sliderrelief="flat", borderwidth=0)
-        self.style.map('Horizontal.TScale', background=[('active', self.colors["accent_teal"])], troughcolor=[('disabled', self.colors["disabled_bg"])])
-        self.style.configure("Dark.Horizontal.TProgressbar", troughcolor=self.colors["bg_card"], background=self.colors["accent_teal"], bordercolor=self.colors["bg_card"], darkcolor=self.colors["accent_teal"], lightcolor=self.colors["bg_dark"], troughrelief='flat')
-
-        # --- Pill Combobox Style (Used for Disease, Country, Target) ---
-        combobox_padding = (15, 9)
-        self.style.configure('Pill.TCombobox',
-                             padding=combobox_padding,
-                             borderwidth=1, relief='flat', font=('Segoe UI', 10),
-                             fieldbackground=self.colors["bg_card"],
-                             background=self.colors["bg_card"], # Dropdown list bg
-                             foreground=self.colors["placeholder_text"], # Default placeholder color
-                             arrowcolor=self.colors["text_secondary"], arrowsize=12,
-                             selectbackground=self.colors["accent_teal"], # Dropdown selection bg
-                             selectforeground=self.colors["text_primary"], # Dropdown selection fg
-                             insertcolor=self.colors["text_primary"],
-                             bordercolor=self.colors["bg_card"], # Default border matches background
-                             lightcolor=self.colors["bg_card"], darkcolor=self.colors["bg_card"]) # Remove 3D effect
-
-        self.style.map('Pill.TCombobox',
-            bordercolor=[('focus', self.colors["accent_teal"]), ('!focus', self.colors["bg_card"])],
-            fieldbackground=[('readonly', self.colors["bg_card"]), ('disabled', self.colors["disabled_bg"])],
-            foreground=[('disabled', self.colors["disabled_fg"])],
-            arrowcolor=[('disabled', self.colors["disabled_fg"])]
-            )
-        # Text color (placeholder vs normal) handled via _update_combobox_color
+    def _style_spec(self):
+        """Returns the ttk style table as [(style, configure_kwargs, map_kwargs)] for the current colors."""
+        c = self.colors
+        return [
+            # --- General Styles ---
+            ('.', dict(background=c["bg_dark"], foreground=c["text_primary"], bordercolor=c["bg_card"], font=('Segoe UI', 10)), None),
+            ('TFrame', dict(background=c["bg_dark"]), None),
+            ('Card.TFrame', dict(background=c["bg_card"]), None),
+            ('TLabel', dict(background=c["bg_dark"], foreground=c["text_primary"]), None),
+            ('Secondary.TLabel', dict(foreground=c["text_secondary"]), None),
+            ('Card.TLabel', dict(background=c["bg_card"], foreground=c["text_primary"]), None),
+            ('Horizontal.TScale',
+             dict(background=c["bg_card"], troughcolor=c["bg_dark"], sliderrelief="flat", borderwidth=0),
+             dict(background=[('active', c["accent_teal"])], troughcolor=[('disabled', c["disabled_bg"])])),
+            ("Dark.Horizontal.TProgressbar",
+             dict(troughcolor=c["bg_card"], background=c["accent_teal"], bordercolor=c["bg_card"], darkcolor=c["accent_teal"], lightcolor=c["bg_dark"], troughrelief='flat'),
+             None),
+
+            # --- Pill Combobox Style (Used for Disease, Country, Target) ---
+            ('Pill.TCombobox',
+             dict(padding=(15, 9),
+                  borderwidth=1, relief='flat', font=('Segoe UI', 10),
+                  fieldbackground=c["bg_card"],
+                  background=c["bg_card"], # Dropdown list bg
+                  foreground=c["placeholder_text"], # Default placeholder color
+                  arrowcolor=c["text_secondary"], arrowsize=12,
+                  selectbackground=c["accent_teal"], # Dropdown selection bg
+                  selectforeground=c["text_primary"], # Dropdown selection fg
+                  insertcolor=c["text_primary"],
+                  bordercolor=c["bg_card"], # Default border matches background
+                  lightcolor=c["bg_card"], darkcolor=c["bg_card"]), # Remove 3D effect
+             dict(bordercolor=[('focus', c["accent_teal"]), ('!focus', c["bg_card"])],
+                  fieldbackground=[('readonly', c["bg_card"]), ('disabled', c["disabled_bg"])],
+                  foreground=[('disabled', c["disabled_fg"])],
+                  arrowcolor=[('disabled', c["disabled_fg"])])),
+            # Text color (placeholder vs normal) handled via _update_combobox_color
+
+            # --- Pill Sidebar Button Style ---
+            ('Pill.TButton',
+             dict(background=c["sidebar_bg"], foreground=c["text_secondary"],
+                  font=('Segoe UI', 10, 'bold'), borderwidth=0, relief='flat',
+                  anchor='center', padding=(20, 12), focuscolor=c["sidebar_bg"]),
+             dict(background=[('pressed', c["sidebar_active"]), ('active', c["sidebar_hover"]), ('selected', c["sidebar_active"])],
+                  foreground=[('pressed', c["text_primary"]), ('active', c["text_primary"]), ('selected', c["text_primary"])])),
+        ]
 
-        # --- Pill Sidebar Button Style ---
-        button_padding = (20, 12)
-        self.style.configure('Pill.TButton',
-                             background=self.colors["sidebar_bg"], foreground=self.colors["text_secondary"],
-                             font=('Segoe UI', 10, 'bold'), borderwidth=0, relief='flat',
-                             anchor='center', padding=button_padding, focuscolor=self.colors["sidebar_bg"])
+    def configure_style(self):
+        """Applies the style table in one pass; on re-application only entries that changed are sent to Tk."""
+        if getattr(self, 'style', None) is None:
+            self.style = ttk.Style()
+            self.style.theme_use('clam')
+            self._applied_styles = {}
 
-        self.style.map('Pill.TButton',
-            background=[('pressed', self.colors["sidebar_active"]), ('active', self.colors["sidebar_hover"]), ('selected', self.colors["sidebar_active"])],
-            foreground=[('pressed', self.colors["text_primary"]), ('active', self.colors["text_primary"]), ('selected', self.colors["text_primary"])])
+        for name, options, state_map in self._style_spec():
+            if self._applied_styles.get(name) == (options, state_map): continue # Unchanged since last pass
+            self.style.configure(name, **options)
+            if state_map: self.style.map(name, **state_map)
+            self._applied_styles[name] = (options, state_map)
 
 
     def create_base_layout(self):
@@ -192,30 +247,34 @@ class DarkThemedDiseaseApp:
         self.animated_bg_canvas = Canvas(self.root, bg=self.colors["bg_dark"], highlightthickness=0)
         self.animated_bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
         
-        # Create particle effects
-        self.particles = []
-        for _ in range(30):  # Number of particles
-            x = np.random.randint(0, self.root.winfo_screenwidth())
-            y = np.random.randint(0, self.root.winfo_screenheight())
-            size = np.random.randint(2, 5)
-            speed = np.random.uniform(0.3, 1.2)
-            direction = np.random.uniform(0, 2*np.pi)
-            color = self.colors["particle_color"]
-            alpha = np.random.uniform(0.3, 0.7)
-            
-            particle = {
-                'id': None,
-                'x': x,
-                'y': y,
-                'size': size,
-                'speed': speed,
-                'direction': direction,
-                'color': color,
-                'alpha': alpha
-            }
-            self.particles.append(particle)
+        # Create particle effects (struct-of-arrays so a frame is one vectorized step)
+        n_particles = 30  # Number of particles
+        screen_w, screen_h = self.root.winfo_screenwidth(), self.root.winfo_screenheight()
+        self._rng = np.random.default_rng() # One generator for setup and per-frame direction changes
+        self._px = self._rng.integers(0, screen_w, n_particles).astype(float)
+        self._py = self._rng.integers(0, screen_h, n_particles).astype(float)
+        self._size = self._rng.integers(2, 5, n_particles)
+        self._speed = self._rng.uniform(0.3, 1.2, n_particles)
+        direction = self._rng.uniform(0, 2*np.pi, n_particles)
+        self._vx = self._speed * np.cos(direction)
+        self._vy = self._speed * np.sin(direction)
+        color = self.colors["particle_color"]
+        # Each particle gets one canvas item for its lifetime; frames only move it
+        self._ids = [
+            self.animated_bg_canvas.create_oval(
+                x - size, y - size, x + size, y + size,
+                fill=color, outline="", tags="particle"
+            )
+            for x, y, size in zip(self._px.tolist(), self._py.tolist(), self._size.tolist())
+        ]
+        
+        # Window size for the wrap-around, refreshed on <Configure> instead of polled per frame
+        self._bg_w, self._bg_h = self.root.winfo_width(), self.root.winfo_height()
+        self.root.bind("<Configure>", self._on_root_configure, add="+")
         
-        # Start animation
+        # Start animation (paused while the window is minimized)
+        self.root.bind("<Unmap>", self._on_root_visibility, add="+")
+        self.root.bind("<Map>", self._on_root_visibility, add="+")
         self._animate_background()
         
         # Sidebar Frame (placed above the canvas)
@@ -237,56 +296,55 @@ class DarkThemedDiseaseApp:
         # Make the content area translucent to show background animation
         self.content_area.configure(bg=self.colors["bg_dark"])
         
+    def _on_root_visibility(self, event):
+        """Track whether the main window is minimized (root bindings also fire for children)."""
+        if event.widget is self.root:
+            self._bg_hidden = event.type == tk.EventType.Unmap
+
+    def _on_root_configure(self, event):
+        """Cache the main window size for the background animation."""
+        if event.widget is self.root:
+            self._bg_w, self._bg_h = event.width, event.height
+
     def _animate_background(self):
         """Animate the particles in the background"""
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+        if self._ui_busy or self._bg_hidden:  # Leave the main loop to loading/analysis work
+            self.root.after(200, self._animate_background)
+            return
+        
+        width, height = self._bg_w, self._bg_h
         
         if width <= 1 or height <= 1:  # Window not fully initialized
             self.root.after(100, self._animate_background)
             return
             
-        # Clear previous particles
-        self.animated_bg_canvas.delete("particle")
+        # Update positions for all particles at once, wrapping around the window
+        self._px += self._vx
+        self._py += self._vy
+        np.mod(self._px, width, out=self._px)
+        np.mod(self._py, height, out=self._py)
         
-        # Update and draw particles
-        for particle in self.particles:
-            # Update position
-            dx = particle['speed'] * np.cos(particle['direction'])
-            dy = particle['speed'] * np.sin(particle['direction'])
-            
-            particle['x'] += dx
-            particle['y'] += dy
-            
-            # Wrap around screen
-            if particle['x'] < 0:
-                particle['x'] = width
-            elif particle['x'] > width:
-                particle['x'] = 0
-                
-            if particle['y'] < 0:
-                particle['y'] = height
-            elif particle['y'] > height:
-                particle['y'] = 0
-                
-            # Draw the particle
-            x, y, size = particle['x'], particle['y'], particle['size']
-            alpha_hex = int(particle['alpha'] * 255)
-            color = particle['color'] if isinstance(particle['color'], str) else f"#{alpha_hex:02x}{particle['color'][1:]}"
-            
-            particle['id'] = self.animated_bg_canvas.create_oval(
-                x - size, y - size, x + size, y + size, 
-                fill=color, outline="", tags="particle"
-            )
-            
-            # Randomly change direction occasionally
-            if np.random.random() < 0.02:  # 2% chance to change direction
-                particle['direction'] = np.random.uniform(0, 2*np.pi)
+        # Randomly change direction occasionally (2% chance per particle)
+        turn = self._rng.random(self._px.size) < 0.02
+        if turn.any():
+            direction = self._rng.uniform(0, 2*np.pi, turn.sum())
+            self._vx[turn] = self._speed[turn] * np.cos(direction)
+            self._vy[turn] = self._speed[turn] * np.sin(direction)
         
-        # Schedule the next animation frame
-        self.root.after(50, self._animate_background)
+        # Move the particles' existing ovals (items are persistent, see create_base_layout)
+        coords = self.animated_bg_canvas.coords
+        for pid, x, y, size in zip(self._ids, self._px.tolist(), self._py.tolist(), self._size.tolist()):
+            coords(pid, x - size, y - size, x + size, y + size)
+        
+        # Schedule the next animation frame (~15 fps)
+        self.root.after(66, self._animate_background)
 
     def create_header_controls(self):
+        # Placeholder/focus coloring for every combobox: one class-level binding per event
+        # (runs after each widget's own <<ComboboxSelected>> handler)
+        for sequence in ("<FocusIn>", "<FocusOut>", "<<ComboboxSelected>>"):
+            self.root.bind_class("TCombobox", sequence, self._update_combobox_color, add='+')
+
         # --- Disease Combobox ---
         self.disease_combobox = ttk.Combobox(
             self.header_frame, textvariable=self.current_disease, values=self.available_diseases,
@@ -295,9 +353,6 @@ class DarkThemedDiseaseApp:
         self.disease_combobox.pack(side="left", padx=(0, 15), pady=15, ipady=2)
         # *** BINDING MODIFIED: Now directly triggers loading logic ***
         self.disease_combobox.bind("<<ComboboxSelected>>", self.on_disease_change)
-        self.disease_combobox.bind("<<ComboboxSelected>>", self._update_combobox_color, add='+') # Keep color update
-        self.disease_combobox.bind("<FocusIn>", self._update_combobox_color, add='+')
-        self.disease_combobox.bind("<FocusOut>", self._update_combobox_color, add='+')
 
         # --- Country Combobox ---
         self.country_combobox = ttk.Combobox(
@@ -305,9 +360,6 @@ class DarkThemedDiseaseApp:
             state="disabled", width=22, font=("Segoe UI", 10), style='Pill.TCombobox'
         )
         self.country_combobox.bind("<<ComboboxSelected>>", self.on_country_change)
-        self.country_combobox.bind("<<ComboboxSelected>>", self._update_combobox_color, add='+')
-        self.country_combobox.bind("<FocusIn>", self._update_combobox_color, add='+')
-        self.country_combobox.bind("<FocusOut>", self._update_combobox_color, add='+')
 
         # --- Target (Cases/Deaths) Combobox ---
         self.target_combobox = ttk.Combobox(
@@ -315,9 +367,9 @@ class DarkThemedDiseaseApp:
             state="disabled", width=10, font=("Segoe UI", 10), style='Pill.TCombobox'
         )
         self.target_combobox.bind("<<ComboboxSelected>>", self.on_target_change)
-        self.target_combobox.bind("<<ComboboxSelected>>", self._update_combobox_color, add='+')
-        self.target_combobox.bind("<FocusIn>", self._update_combobox_color, add='+')
-        self.target_combobox.bind("<FocusOut>", self._update_combobox_color, add='+')
+        # Seed the shadow cache with the constructor options so the first refresh only pushes real changes
+        self._widget_state_cache[self.country_combobox] = {'state': "disabled", 'values': ()}
+        self._widget_state_cache[self.target_combobox] = {'state': "disabled", 'values': tuple(self.available_targets)}
 
         # --- Buttons ---
         # *** Load Button is created but will be disabled by on_disease_change ***
@@ -375,21 +427,13 @@ class DarkThemedDiseaseApp:
             # Mettre à jour l'état avant le changement
             frame = self.view_frames[view_name]
             
-            # Préparer la vue avant le changement
-            frame.update_idletasks()
-            
-            # Afficher la nouvelle vue
+            # Afficher la nouvelle vue (toutes les vues partagent la même cellule de grille, déjà dimensionnée;
+            # Tk redessine au prochain passage de la boucle, sans update_idletasks forcé)
             frame.tkraise()
             self.active_view_name.set(view_name)
             print(f"[UI] Switched to view: {view_name}")
             self._update_sidebar_button_state(view_name)
             
-            # S'assurer que la nouvelle vue a la bonne taille
-            frame.update_idletasks()
-            
-            # Forcer une mise à jour pour éviter les problèmes d'affichage
-            self.root.update_idletasks()
-            
             # When returning to dashboard, refresh its statistics from the most recent analysis
             if view_name == "dashboard" and self.disease_data is not None and self.current_target_col_name is not None:
                 dashboard_view = self.view_frames.get("dashboard")
@@ -402,19 +446,18 @@ class DarkThemedDiseaseApp:
 
     def _update_sidebar_button_state(self, active_view_name):
         """Updates the visual state of sidebar buttons (selected/not selected)."""
-        for name, button in self.sidebar_buttons.items():
-            if isinstance(button, ttk.Button):
-                current_state_tuple = button.state() # Get current state as tuple
-                is_currently_selected = 'selected' in current_state_tuple
-                should_be_selected = name == active_view_name
+        previous = self._selected_sidebar
+        if previous == active_view_name: return # Nothing changed
+        # Only the previously selected and the newly selected buttons need touching
+        prev_button = self.sidebar_buttons.get(previous)
+        if isinstance(prev_button, ttk.Button): prev_button.state(['!selected'])
+        active_button = self.sidebar_buttons.get(active_view_name)
+        if isinstance(active_button, ttk.Button): active_button.state(['selected'])
+        self._selected_sidebar = active_view_name
 
-                if should_be_selected and not is_currently_selected:
-                    new_state_list = list(current_state_tuple) + ['selected']
-                    button.state(tuple(new_state_list)) # Set the new combined state
-                elif not should_be_selected and is_currently_selected:
-                    new_state_list = [s for s in current_state_tuple if s != 'selected']
-                    button.state(tuple(new_state_list)) # Set the new filtered state
 
+    _COMBOBOX_PLACEHOLDERS = frozenset(("Select Disease", "Select Country", "Select Target"))
+    _combobox_color_error_reported = False
 
     def _update_combobox_color(self, event=None, widget=None):
         """Updates combobox text color based on content, focus, and state."""
@@ -422,20 +465,17 @@ class DarkThemedDiseaseApp:
         if not isinstance(widget, ttk.Combobox): return
 
         try:
-            current_value = widget.get()
-            is_placeholder = False
-            placeholder_text = ""
-
-            if widget == self.disease_combobox: placeholder_text = "Select Disease"
-            elif widget == self.country_combobox: placeholder_text = "Select Country"
-            elif widget == self.target_combobox: placeholder_text = "Select Target"
-
-            if current_value in ["Select Disease", "Select Country", "Select Target"]:
-                is_placeholder = True
-
-            is_focused = self.root.focus_get() == widget
-            current_widget_state = widget.state() # Returns a tuple of states
-            is_disabled = 'disabled' in current_widget_state
+            # Focus is tracked from the bound FocusIn/FocusOut events instead of asking Tk via focus_get()
+            if event is not None and event.type == tk.EventType.FocusIn:
+                self._focused_combobox = widget
+            elif event is not None and event.type == tk.EventType.FocusOut and self._focused_combobox is widget:
+                self._focused_combobox = None
+
+            is_placeholder = widget.get() in self._COMBOBOX_PLACEHOLDERS
+            is_focused = self._focused_combobox is widget
+            applied_state = self._widget_state_cache.get(widget, {}).get('state')
+            # State set through _apply_widget_options is known locally; only ask Tk for widgets it never touched
+            is_disabled = applied_state == "disabled" if applied_state is not None else widget.instate(['disabled'])
 
             new_color = self.colors["text_primary"] # Default: Normal text
 
@@ -444,10 +484,17 @@ class DarkThemedDiseaseApp:
             elif is_placeholder and not is_focused:
                 new_color = self.colors["placeholder_text"]
 
-            widget.configure(foreground=new_color)
+            if self._combobox_colors.get(widget) != new_color: # Skip the configure round-trip when unchanged
+                widget.configure(foreground=new_color)
+                self._combobox_colors[widget] = new_color
 
         except tk.TclError: pass # Widget might be destroyed
-        except Exception as e: print(f"Unexpected error updating combobox color: {e}"); traceback.print_exc()
+        except Exception as e:
+            # Runs on every focus/selection event: report once, not a traceback per event
+            if not self._combobox_color_error_reported:
+                self._combobox_color_error_reported = True
+                print(f"Unexpected error updating combobox color (further errors suppressed): {e}")
+                if config.DEBUG_TRACEBACKS: traceback.print_exc()
 
 
     # --- Controller Methods ---
@@ -466,14 +513,167 @@ class DarkThemedDiseaseApp:
         except Exception as e: print(f"Error updating prediction days label: {e}")
 
 
+    @property
+    def disease_data(self):
+        """Processed frame for the selected disease/country/target (None until processed)."""
+        return self._disease_data
+
+    @disease_data.setter
+    def disease_data(self, frame):
+        self._disease_data = frame
+        self._disease_data_ready = frame is not None and not frame.empty # Derived once per assignment, not per check
+        self._last_stats = None # (target column, stats dict) for this frame, see _analysis_stats
+
+    def _analysis_stats(self, target_col_name):
+        """Returns calculate_analysis_stats for the current frame, computed once per frame and target."""
+        if self._last_stats is None or self._last_stats[0] != target_col_name:
+            self._last_stats = (target_col_name, analysis.calculate_analysis_stats(self.disease_data, target_col_name))
+        return self._last_stats[1]
+
+    # Real-data diseases -> (raw frame attribute, allowed-countries attribute)
+    _DISEASE_DATA_ATTRS = {
+        "COVID-19": ("raw_covid_data", "allowed_covid_countries_in_data"),
+        "Grippe": ("raw_influenza_data", "allowed_influenza_countries_in_data"),
+        "Zika": ("raw_zika_data", "allowed_zika_countries_in_data"),
+    }
+
+    # How each preprocessor matches a country against its raw column (see processing.preprocess_*_data)
+    _COUNTRY_MATCH = {
+        "COVID-19": ('country', None),
+        "Grippe": (config.GRIPPE_RAW_COUNTRY_COL, lambda name: name.strip().lower()),
+        "Zika": (config.ZIKA_COUNTRY_COL, str.strip),
+    }
+
+    def _index_raw_countries(self, disease):
+        """Builds the country -> row positions index for a freshly loaded raw frame (loader thread)."""
+        raw_data = self._raw_data_for(disease)
+        country_col, normalize = self._COUNTRY_MATCH[disease]
+        try:
+            index = processing.country_row_index(raw_data, country_col, normalize)
+        except Exception as e: # Only a shortcut: preprocessing falls back to filtering the full frame
+            print(f"[Warning] Could not index {disease} rows by country: {e}")
+            index = None
+        self._raw_country_index[disease] = (raw_data, index)
+
+    def _raw_country_rows(self, disease, country):
+        """The raw rows the preprocessor would select for country, or the whole raw frame when not indexed."""
+        raw_data = self._raw_data_for(disease)
+        entry = self._raw_country_index.get(disease)
+        if entry is None or entry[0] is not raw_data or entry[1] is None:
+            return raw_data
+        _, normalize = self._COUNTRY_MATCH[disease]
+        positions = entry[1].get(normalize(country) if normalize else country)
+        if positions is None: return raw_data # Let the preprocessor report the missing country as usual
+        return raw_data.iloc[positions]
+
+    def _raw_data_for(self, disease):
+        """Returns the loaded raw frame for a real-data disease, or None."""
+        attrs = self._DISEASE_DATA_ATTRS.get(disease)
+        return getattr(self, attrs[0]) if attrs else None
+
+    def _allowed_countries_for(self, disease):
+        """Returns the selectable countries found in a real-data disease's file ([] if none)."""
+        attrs = self._DISEASE_DATA_ATTRS.get(disease)
+        return getattr(self, attrs[1]) if attrs else []
+
+    def _reset_raw_data(self, disease):
+        """Drops the raw frame and country list for a real-data disease (no-op for simulated ones)."""
+        attrs = self._DISEASE_DATA_ATTRS.get(disease)
+        if attrs:
+            setattr(self, attrs[0], None)
+            setattr(self, attrs[1], [])
+            self._refresh_valid_countries()
+
+    def _refresh_valid_countries(self):
+        """Rebuilds the country-selection lookup set; call whenever an allowed-countries list changes."""
+        self._valid_countries_set = set().union(
+            *(getattr(self, attrs[1]) for attrs in self._DISEASE_DATA_ATTRS.values()))
+        self._country_values_cache = {}
+        self._last_ui_sig = None
+
+    def _country_values_for(self, disease):
+        """Country combobox values (placeholder first) for a real-data disease, built once per load."""
+        values = self._country_values_cache.get(disease)
+        if values is None:
+            values = self._country_values_cache[disease] = ("Select Country", *self._allowed_countries_for(disease))
+        return values
+
+    def _notify_fields(self):
+        """field -> variable shown for it (status bar / dashboard), or None when the widget doesn't exist yet."""
+        bar = self.status_bar
+        dashboard_view = self.view_frames.get("dashboard")
+        return {'status': bar.status_var if bar else None, 'progress': bar.progress_var if bar else None,
+                'risk': bar.risk_value_var if bar else None,
+                'dashboard': dashboard_view.status_message if dashboard_view else None}
+
+    def _notify(self, status=None, progress=None, dashboard=None, risk=None):
+        """Queues one logical event for the status bar and dashboard; a burst of calls is applied once,
+        with the latest value per field, by _flush_notify on the next idle pass."""
+        shown = self._notify_fields()
+        for field, value in (('status', status), ('progress', progress), ('dashboard', dashboard), ('risk', risk)):
+            if value is not None and shown[field] is not None:
+                previous = self._pending_notify.get(field)
+                # Keep the widget value from the first queued call: a direct write after it is detected at flush
+                baseline = previous[1] if previous else shown[field].get()
+                self._pending_notify[field] = (value, baseline)
+        if self._pending_notify and self._notify_job is None:
+            self._notify_job = self.root.after_idle(self._flush_notify)
+
+    def _flush_notify(self):
+        """Applies the queued _notify values now (also call before reading the status text back).
+
+        A field whose widget was written directly after it was queued is skipped, so that later direct
+        write still wins as it did when _notify wrote immediately. Text already shown is not rewritten.
+        """
+        if self._notify_job is not None:
+            self.root.after_cancel(self._notify_job)
+            self._notify_job = None
+        pending, self._pending_notify = self._pending_notify, {}
+        shown = self._notify_fields()
+        for field, (value, baseline) in pending.items():
+            var = shown[field]
+            if var is None or var.get() != baseline:
+                continue # Widget gone, or overwritten directly since this value was queued
+            if field == 'progress':
+                self.status_bar.set_progress(value) # Always applied: it also leaves indeterminate mode
+            elif field == 'status' and var.get() != value:
+                self.status_bar.set_status(value)
+            elif field == 'risk' and var.get().lower() != str(value).lower():
+                self.status_bar.set_risk(value)
+            elif field == 'dashboard' and var.get() != value:
+                self.view_frames["dashboard"].update_status(value)
+
+    def _debounce(self, key, handler):
+        """Run handler once selections settle; a newer change for the same key cancels the pending one."""
+        pending = self._pending_handler.pop(key, None)
+        if pending:
+            self.root.after_cancel(pending[0])
+        def fire():
+            self._pending_handler.pop(key, None)
+            handler()
+        self._pending_handler[key] = (self.root.after(config.SELECTION_DEBOUNCE_MS, fire), handler)
+
+    def _flush_debounced(self, *keys):
+        """Runs the still-pending debounced handlers for keys now, so an action doesn't race a late one."""
+        for key in keys:
+            pending = self._pending_handler.pop(key, None)
+            if pending:
+                self.root.after_cancel(pending[0])
+                pending[1]()
+
     # --- MODIFIED: on_disease_change now triggers loading ---
     def on_disease_change(self, event=None):
+        """Debounces disease selection changes (see _do_disease_change)."""
+        self._debounce('disease', self._do_disease_change)
+
+    def _do_disease_change(self):
         """Handles disease selection change AND triggers data loading."""
         disease = self.current_disease.get()
         print(f"Disease changed to: {disease}")
 
         # --- Reset dependent states ---
         self.disease_data = None # Clear processed data
+        self._processed_stale = False
         self.model = None
         self.scaler_X = None
         self.current_target_col_name = None # Clear processed target name
@@ -486,299 +686,368 @@ class DarkThemedDiseaseApp:
 
         # --- Update state of ALL UI elements (DISABLES things initially) ---
         # This call is important to reset/disable dependent controls like Country, Target, Analyze, Export
-        self._update_ui_element_states()
+        # (run now, before a load may mark the UI busy and defer refreshes until it finishes)
+        self._do_update_ui_element_states()
 
         # --- Handle "Select Disease" placeholder case ---
         if disease == "Select Disease":
             status_msg = "Please select a disease."
-            if self.status_bar: self.status_bar.set_status(status_msg)
-            if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg)
+            self._notify(status=status_msg, dashboard=status_msg)
             # Explicitly ensure buttons dependent on data are disabled
-            if self.analyze_button: self.analyze_button.config(state='disabled')
-            if self.export_all_button: self.export_all_button.config(state='disabled')
+            if self.analyze_button: self._apply_widget_options(self.analyze_button, state='disabled')
+            if self.export_all_button: self._apply_widget_options(self.export_all_button, state='disabled')
             # Load button is already disabled or will be handled below
             return # Stop here if placeholder selected
 
         # --- Disable the Load Data button permanently in this workflow ---
         if self.load_button:
-            self.load_button.config(state='disabled')
+            self._apply_widget_options(self.load_button, state='disabled')
             # Optionally hide it completely:
             # self.load_button.pack_forget()
 
         # --- Check if data is already loaded for the selected disease ---
-        already_loaded = False
-        if disease == "COVID-19" and self.raw_covid_data is not None: already_loaded=True
-        elif disease == "Grippe" and self.raw_influenza_data is not None: already_loaded=True
-        elif disease == "Zika" and self.raw_zika_data is not None: already_loaded=True
+        already_loaded = self._raw_data_for(disease) is not None
         # Add checks for other non-simulated diseases if implemented
 
         if already_loaded:
             status_msg=f"{disease} data already loaded. "
             # Update status and UI states to reflect loaded data and prompt for next steps
-            if disease in ["COVID-19", "Grippe", "Zika"]: status_msg += "Select Country"
+            if disease in self._DISEASE_DATA_ATTRS: status_msg += "Select Country"
             if disease == "COVID-19": status_msg += f" & Target ({self.selected_target.get()})"
             status_msg += ", then Analyze. Or 'Export Cleaned'."
 
-            if self.status_bar: self.status_bar.set_status(status_msg)
-            if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg)
+            self._notify(status=status_msg, dashboard=status_msg)
             self._update_ui_element_states() # Re-enable controls based on loaded data
             return # Stop here if already loaded
 
         # --- If not placeholder and not already loaded, START LOADING ---
         status_msg_loading = f"Auto-loading data for {disease}..."
-        if self.status_bar: self.status_bar.set_status(status_msg_loading)
-        if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg_loading)
+        self._notify(status=status_msg_loading, dashboard=status_msg_loading)
         self._set_ui_busy(True, f"Loading {disease}") # Make UI busy
 
         # Reset relevant raw data stores (might be slightly redundant with above, but safe)
-        if disease == "COVID-19":
-            self.raw_covid_data = None
-            self.allowed_covid_countries_in_data = []
-        elif disease == "Grippe":
-            self.raw_influenza_data = None
-            self.allowed_influenza_countries_in_data = []
-        elif disease == "Zika":
-            self.raw_zika_data = None
-            self.allowed_zika_countries_in_data = []
+        self._reset_raw_data(disease)
         # Selections were reset earlier
 
         # Start the data loading thread
-        print(f"--- [on_disease_change] Starting data loading thread for {disease} ---")
-        thread = threading.Thread(target=self._data_loading_thread_target, daemon=True)
-        thread.start()
+        print(f"--- [on_disease_change] Queueing data load for {disease} ---")
+        self._queue_data_load(disease)
     # --- END of MODIFIED on_disease_change ---
 
 
     def on_country_change(self, event=None):
+        """Debounces country selection changes (see _do_country_change)."""
+        self._debounce('country', self._do_country_change)
+
+    def _do_country_change(self):
         """Handles country selection change."""
         country = self.selected_country.get()
         print(f"Country changed to: {country}")
 
         # Clear previous processed data and plots if country changes
         self.disease_data = None
+        self._processed_stale = False
         self.model = None
         self.scaler_X = None
         self.current_target_col_name = None
         self.clear_statistics()
         self.clear_all_view_content()
 
-        self._update_ui_element_states()
+        self._do_update_ui_element_states() # Run now: the status message below reads its snapshot
         self._update_combobox_color(widget=self.country_combobox)
 
-        # Update status message
+        # Update status message (selections as read by _do_update_ui_element_states above)
+        state = self._state_cache
+        disease = state['disease']
         status_msg = f"Country set to {country}. "
-        if self.analyze_button and self.analyze_button.cget('state') != 'disabled':
-            status_msg += f"Select Target ({self.selected_target.get()}) and click 'Analyze'." if self.current_disease.get() == "COVID-19" else "Click 'Analyze'."
+        if state['analyze_enabled']:
+            status_msg += f"Select Target ({state['target']}) and click 'Analyze'." if disease == "COVID-19" else "Click 'Analyze'."
         else:
             # More specific message needed if analyze isn't ready
-            disease = self.current_disease.get()
             if disease == "Select Disease": status_msg += "Select Disease first."
-            elif disease in ["COVID-19", "Grippe", "Zika"]: status_msg += "Data loaded. Analyze ready." # Should be ready if country selected
+            elif disease in self._DISEASE_DATA_ATTRS: status_msg += "Data loaded. Analyze ready." # Should be ready if country selected
             else: status_msg += "Check selections."
         if self.status_bar: self.status_bar.set_status(status_msg)
 
 
     def on_target_change(self, event=None):
+        """Debounces target selection changes (see _do_target_change)."""
+        self._debounce('target', self._do_target_change)
+
+    def _do_target_change(self):
         """Handles target (Cases/Deaths) selection change."""
         target = self.selected_target.get()
-        disease = self.current_disease.get()
         print(f"Target changed to: {target}")
 
-        # Clear previous processed data, model, plots, and stats as the target has changed
-        self.disease_data = None
+        # The processed data is for the previous target: mark it stale (blocks forecasting) but keep
+        # its plots and stats on screen until Analyze reprocesses, instead of tearing the views down
+        self._processed_stale = True
         self.model = None
         self.scaler_X = None
-        self.current_target_col_name = None
-        self.clear_statistics()
-        self.clear_all_view_content()
 
-        self._update_ui_element_states()
+        self._do_update_ui_element_states() # Run now: the status message below reads its snapshot
         self._update_combobox_color(widget=self.target_combobox)
 
         # Update status bar - Prompt user to click Analyze again
+        state = self._state_cache
+        disease = state['disease']
         status_msg = f"Target set to {target}. "
-        if self.analyze_button and self.analyze_button.cget('state') != 'disabled':
+        if state['analyze_enabled']:
              status_msg += "Click 'Analyze' to process and view results."
         else:
             if disease == "Select Disease": status_msg += "Select a disease first."
-            elif disease in ["COVID-19", "Grippe", "Zika"] and self.selected_country.get() == "Select Country": status_msg += "Select a country first."
+            elif disease in self._DISEASE_DATA_ATTRS and state['country'] == "Select Country": status_msg += "Select a country first."
             # Data should be loaded if target selector is enabled, so no need to check raw_data here
             else: status_msg += "Check selections."
 
-        if self.status_bar: self.status_bar.set_status(status_msg)
-        if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg)
+        self._notify(status=status_msg, dashboard=status_msg)
 
 
-    def _update_ui_element_states(self):
-        """Central function to update the state (enabled/disabled/values) and layout of header controls."""
+    def _apply_widget_options(self, widget, **options):
+        """Configures only the options that differ from what was last applied to this widget.
+
+        Control states are always set through here, so the shadow copy in self._widget_state_cache
+        matches the widgets and no cget() round-trip is needed to diff them.
+        """
+        if not self._in_ui_refresh: # Someone else touched control state; the next refresh must run in full
+            self._last_ui_sig = None
+        if self._widget_batch_depth: # Inside a batch: merge, last write wins, applied on flush
+            self._pending_widget_options.setdefault(widget, {}).update(options)
+            return
+        applied = self._widget_state_cache.setdefault(widget, {})
+        # Identity first: the cached country-values tuple is reused as-is, so the element-wise compare is skipped
+        changed = {key: value for key, value in options.items()
+                   if (previous := applied.get(key)) is not value and previous != value}
+        if changed:
+            widget.config(**changed)
+            applied.update(changed)
+
+    def _begin_widget_batch(self):
+        self._widget_batch_depth += 1
+
+    def _end_widget_batch(self):
+        """Closes a batch; the outermost one issues at most one config() per queued widget."""
+        self._widget_batch_depth -= 1
+        if self._widget_batch_depth: return
+        pending, self._pending_widget_options = self._pending_widget_options, {}
+        for widget, options in pending.items():
+            try:
+                self._apply_widget_options(widget, **options)
+            except tk.TclError: pass # Control might be destroyed or in bad state
+
+    @contextlib.contextmanager
+    def _batched_widget_updates(self):
+        """Defers _apply_widget_options calls made inside the block until it exits (re-entrant)."""
+        self._begin_widget_batch()
         try:
-            disease = self.current_disease.get()
-            country = self.selected_country.get()
-            target = self.selected_target.get()
-
-            # --- Determine if raw data is loaded ---
-            raw_covid_loaded = self.raw_covid_data is not None and self.allowed_covid_countries_in_data
-            raw_grippe_loaded = self.raw_influenza_data is not None and self.allowed_influenza_countries_in_data
-            raw_zika_loaded = self.raw_zika_data is not None and self.allowed_zika_countries_in_data
-            any_raw_data_loaded = raw_covid_loaded or raw_grippe_loaded or raw_zika_loaded
-
-            # --- Country Combobox State ---
-            show_country_selector = False
-            enable_country_selector = False
-            country_list = ["Select Country"]
-
-            if disease in ["COVID-19", "Grippe", "Zika"] and disease != "Select Disease":
-                show_country_selector = True
-                if disease == "COVID-19" and raw_covid_loaded:
-                    enable_country_selector = True
-                    country_list.extend(self.allowed_covid_countries_in_data)
-                elif disease == "Grippe" and raw_grippe_loaded:
-                    enable_country_selector = True
-                    country_list.extend(self.allowed_influenza_countries_in_data)
-                elif disease == "Zika" and raw_zika_loaded:
-                    enable_country_selector = True
-                    country_list.extend(self.allowed_zika_countries_in_data)
-
-            # Update Country Combobox Visibility & State
-            if self.country_combobox:
-                current_country_state = self.country_combobox.cget('state')
-                new_country_state = "readonly" if enable_country_selector else "disabled"
-
-                if show_country_selector:
-                    if not self.country_combobox.winfo_ismapped():
-                        self.country_combobox.pack(side="left", padx=(0, 15), pady=15, ipady=2)
-                        self.country_combobox.pack_configure(before=self.target_combobox if self.target_combobox and self.target_combobox.winfo_ismapped() else self.load_button)
-
-                    if current_country_state != new_country_state:
-                        self.country_combobox.config(state=new_country_state)
-                    if list(self.country_combobox['values']) != country_list:
-                         self.country_combobox.config(values=country_list)
-
-                    valid_selections = self.allowed_covid_countries_in_data + self.allowed_influenza_countries_in_data + self.allowed_zika_countries_in_data
-                    if new_country_state == "disabled" or (country != "Select Country" and country not in valid_selections):
-                        if self.selected_country.get() != "Select Country":
-                            self.selected_country.set("Select Country")
-                else:
-                    if self.country_combobox.winfo_ismapped():
-                        self.country_combobox.pack_forget()
-                    if self.selected_country.get() != "Select Country":
-                        self.selected_country.set("Select Country")
-            
-            # --- Target Combobox State ---
-            show_target_selector = False
-            enable_target_selector = False
-            target_list = config.ANALYSIS_TARGETS
-            if (disease == "COVID-19" and raw_covid_loaded) or (disease == "Zika" and raw_zika_loaded):
-                 show_target_selector = True
-                 enable_target_selector = True
-
-            if self.target_combobox:
-                current_target_state = self.target_combobox.cget('state')
-                new_target_state = "readonly" if enable_target_selector else "disabled"
-                if show_target_selector:
-                    if not self.target_combobox.winfo_ismapped():
-                        self.target_combobox.pack(side="left", padx=(0, 15), pady=15, ipady=2)
-                        self.target_combobox.pack_configure(before=self.analyze_button)
-                    if current_target_state != new_target_state:
-                        self.target_combobox.config(state=new_target_state)
-                    if list(self.target_combobox['values']) != target_list:
-                         self.target_combobox.config(values=target_list)
-                    if new_target_state == "disabled":
-                        if self.selected_target.get() != config.DEFAULT_ANALYSIS_TARGET:
-                             self.selected_target.set(config.DEFAULT_ANALYSIS_TARGET)
-                    elif self.selected_target.get() not in target_list: 
-                        self.selected_target.set(config.DEFAULT_ANALYSIS_TARGET) 
-                else:
-                     if self.target_combobox.winfo_ismapped():
-                         self.target_combobox.pack_forget()
-                     if self.selected_target.get() != config.DEFAULT_ANALYSIS_TARGET: 
-                         self.selected_target.set(config.DEFAULT_ANALYSIS_TARGET)
-
-            # --- Button States ---
-            disease_is_selected = disease != "Select Disease"
-            country_is_selected = country != "Select Country"
-
-            # Analyze button logic (for single selected country)
-            can_analyze_now = False
-            if disease_is_selected:
-                if disease in ["COVID-19", "Grippe", "Zika"]:
-                    raw_data_loaded_for_disease = (disease == "COVID-19" and raw_covid_loaded) or \
-                                                  (disease == "Grippe" and raw_grippe_loaded) or \
-                                                  (disease == "Zika" and raw_zika_loaded)
-                    can_analyze_now = raw_data_loaded_for_disease and country_is_selected
-                elif disease in config.AVAILABLE_DISEASES: # Simulated/Other
-                     # Processed data (`self.disease_data`) is loaded during the auto-load via on_disease_change
-                     can_analyze_now = self.disease_data is not None and not self.disease_data.empty
-
-            analyze_state = "normal" if can_analyze_now else "disabled"
-
-            # Export All button logic - Enabled if *any* raw data is loaded
-            export_all_state = "normal" if any_raw_data_loaded else "disabled"
-
-            # Prediction button/slider logic (depends on single analysis completion)
-            data_processed_for_target = (self.disease_data is not None and not self.disease_data.empty and self.current_target_col_name is not None)
-            predict_state_tk = "normal" if data_processed_for_target else "disabled"
-
-            # Apply states to Buttons only if state has changed
-            if self.analyze_button and self.analyze_button.cget('state') != analyze_state:
-                 self.analyze_button.config(state=analyze_state)
-            if self.export_all_button and self.export_all_button.cget('state') != export_all_state:
-                 self.export_all_button.config(state=export_all_state)
-
-            # Apply states to Prediction View components
-            if "prediction" in self.view_frames:
-                 pred_view = self.view_frames["prediction"]
-                 pred_button = pred_view.get_predict_button()
-                 pred_slider = pred_view.get_slider()
-                 if pred_button and pred_button.cget('state') != predict_state_tk: # GlowButton state is 'normal' or 'disabled'
-                     pred_button.config(state=predict_state_tk)
-                 if pred_slider and pred_slider.cget('state') != predict_state_tk:
-                     pred_slider.config(state=predict_state_tk)
+            yield
+        finally:
+            self._end_widget_batch()
 
+    def _is_packed(self, widget):
+        """Whether _set_packed last packed this widget (instead of asking Tk via winfo_ismapped)."""
+        return bool(widget) and self._widget_state_cache.get(widget, {}).get('packed', False)
+
+    def _set_packed(self, widget, packed, **pack_options):
+        """Packs or forgets a header control; returns True if anything changed."""
+        if self._is_packed(widget) == packed: return False
+        if packed: widget.pack(**pack_options)
+        else: widget.pack_forget()
+        self._widget_state_cache.setdefault(widget, {})['packed'] = packed
+        return True
+
+    def _update_ui_element_states(self):
+        """Schedules one control-state refresh for the next idle tick, so bursts of calls coalesce."""
+        if self._ui_update_pending is None:
+            self._ui_update_pending = self.root.after_idle(self._run_pending_ui_update)
+
+    def _run_pending_ui_update(self):
+        self._ui_update_pending = None
+        if self._ui_busy: return # _set_ui_busy(False) schedules a fresh refresh; don't re-enable controls mid-task
+        self._do_update_ui_element_states()
+
+    def _ui_inputs_signature(self):
+        """Everything _do_update_ui_element_states derives control state from; equal signatures, equal states."""
+        return (self.current_disease.get(), self.selected_country.get(), self.selected_target.get(),
+                *(getattr(self, raw) is not None and bool(getattr(self, allowed))
+                  for raw, allowed in self._DISEASE_DATA_ATTRS.values()),
+                self._disease_data_ready, self.current_target_col_name, self._processed_stale)
+
+    def _do_update_ui_element_states(self):
+        """Central function to update the state (enabled/disabled/values) and layout of header controls.
+
+        Handles skipping, batching and the error fallback; the state logic itself is _apply_ui_element_states.
+        """
+        if self.country_combobox is None: return # Header controls not built yet
+        if self._ui_update_pending is not None: # Running now supersedes the scheduled refresh
+            self.root.after_cancel(self._ui_update_pending)
+            self._ui_update_pending = None
+        if self._last_ui_sig is not None and self._ui_inputs_signature() == self._last_ui_sig:
+            return # Nothing this refresh depends on has changed since the last one
+        self._last_ui_sig = None # Stays None if the refresh fails
+        self._in_ui_refresh = True
+        self._begin_widget_batch() # Normal and error-path writes merge; flushed before the colors below
+        try:
+            self._apply_ui_element_states()
+            self._last_ui_sig = self._ui_inputs_signature() # Taken after any selection resets
         except Exception as e:
-            print(f"CRITICAL ERROR in _update_ui_element_states: {e}")
-            import traceback # Ensure traceback is available in this scope if not already
-            traceback.print_exc()
-            if self.status_bar:
-                self.status_bar.set_status(f"UI Update Error. Check console.")
-            
-            # Attempt to disable most interactive controls to indicate an error state
-            controls_to_disable_on_error = [
-                self.country_combobox, self.target_combobox,
-                self.analyze_button, self.export_all_button, self.load_button 
-            ]
-            if "prediction" in self.view_frames:
-                pred_view = self.view_frames["prediction"]
-                if hasattr(pred_view, 'get_predict_button') and pred_view.get_predict_button():
-                    controls_to_disable_on_error.append(pred_view.get_predict_button())
-                if hasattr(pred_view, 'get_slider') and pred_view.get_slider():
-                    controls_to_disable_on_error.append(pred_view.get_slider())
-
-            for control in controls_to_disable_on_error:
-                if control:
-                    try:
-                        control.config(state='disabled')
-                    except tk.TclError: # Control might be destroyed or in bad state
-                        pass
-            # Ensure disease combobox is usable to allow user to try selecting another option
-            if self.disease_combobox:
-                try:
-                    self.disease_combobox.config(state='readonly')
-                except tk.TclError:
-                    pass
+            self._disable_controls_after_ui_error(e)
         finally:
+            self._end_widget_batch()
+            self._in_ui_refresh = False
             # These color updates have their own internal error handling (tk.TclError)
             self._update_combobox_color(widget=self.disease_combobox)
             self._update_combobox_color(widget=self.country_combobox)
             self._update_combobox_color(widget=self.target_combobox)
 
+    def _apply_ui_element_states(self):
+        """Derives and applies header/prediction control state from the current selections and loaded data."""
+        disease = self.current_disease.get()
+        country = self.selected_country.get()
+        target = self.selected_target.get()
+
+        # --- Determine if raw data is loaded ---
+        raw_covid_loaded = self.raw_covid_data is not None and self.allowed_covid_countries_in_data
+        raw_grippe_loaded = self.raw_influenza_data is not None and self.allowed_influenza_countries_in_data
+        raw_zika_loaded = self.raw_zika_data is not None and self.allowed_zika_countries_in_data
+        any_raw_data_loaded = raw_covid_loaded or raw_grippe_loaded or raw_zika_loaded
+
+        # --- Country Combobox State ---
+        show_country_selector = False
+        enable_country_selector = False
+        country_values = ("Select Country",)
+
+        if disease in self._DISEASE_DATA_ATTRS:
+            show_country_selector = True
+            if (disease == "COVID-19" and raw_covid_loaded) or (disease == "Grippe" and raw_grippe_loaded) \
+                    or (disease == "Zika" and raw_zika_loaded):
+                enable_country_selector = True
+                country_values = self._country_values_for(disease)
+
+        # Update Country Combobox Visibility & State
+        # State/values/packing are diffed against self._widget_state_cache, so an unchanged
+        # control costs no Tk calls (see _apply_widget_options/_set_packed)
+        if self.country_combobox:
+            new_country_state = "readonly" if enable_country_selector else "disabled"
+
+            if show_country_selector:
+                if self._set_packed(self.country_combobox, True, side="left", padx=(0, 15), pady=15, ipady=2):
+                    self.country_combobox.pack_configure(before=self.target_combobox if self._is_packed(self.target_combobox) else self.load_button)
+
+                self._apply_widget_options(self.country_combobox, state=new_country_state, values=country_values)
+
+                if new_country_state == "disabled" or (country != "Select Country" and country not in self._valid_countries_set):
+                    if country != "Select Country":
+                        self.selected_country.set("Select Country"); country = "Select Country"
+            else:
+                self._set_packed(self.country_combobox, False)
+                if country != "Select Country":
+                    self.selected_country.set("Select Country"); country = "Select Country"
+        
+        # --- Target Combobox State ---
+        show_target_selector = False
+        enable_target_selector = False
+        target_list = config.ANALYSIS_TARGETS
+        if (disease == "COVID-19" and raw_covid_loaded) or (disease == "Zika" and raw_zika_loaded):
+             show_target_selector = True
+             enable_target_selector = True
+
+        if self.target_combobox:
+            new_target_state = "readonly" if enable_target_selector else "disabled"
+            if show_target_selector:
+                if self._set_packed(self.target_combobox, True, side="left", padx=(0, 15), pady=15, ipady=2):
+                    self.target_combobox.pack_configure(before=self.analyze_button)
+                self._apply_widget_options(self.target_combobox, state=new_target_state, values=tuple(target_list))
+                if new_target_state == "disabled":
+                    if target != config.DEFAULT_ANALYSIS_TARGET:
+                         self.selected_target.set(config.DEFAULT_ANALYSIS_TARGET); target = config.DEFAULT_ANALYSIS_TARGET
+                elif target not in target_list: 
+                    self.selected_target.set(config.DEFAULT_ANALYSIS_TARGET); target = config.DEFAULT_ANALYSIS_TARGET
+            else:
+                 self._set_packed(self.target_combobox, False)
+                 if target != config.DEFAULT_ANALYSIS_TARGET: 
+                     self.selected_target.set(config.DEFAULT_ANALYSIS_TARGET); target = config.DEFAULT_ANALYSIS_TARGET
+
+        # --- Button States ---
+        disease_is_selected = disease != "Select Disease"
+        country_is_selected = country != "Select Country"
+
+        # Analyze button logic (for single selected country)
+        can_analyze_now = False
+        if disease_is_selected:
+            if disease in self._DISEASE_DATA_ATTRS:
+                raw_data_loaded_for_disease = (disease == "COVID-19" and raw_covid_loaded) or \
+                                              (disease == "Grippe" and raw_grippe_loaded) or \
+                                              (disease == "Zika" and raw_zika_loaded)
+                can_analyze_now = raw_data_loaded_for_disease and country_is_selected
+            elif disease in config.AVAILABLE_DISEASES_SET: # Simulated/Other
+                 # Processed data (`self.disease_data`) is loaded during the auto-load via on_disease_change
+                 can_analyze_now = self._disease_data_ready
+
+        analyze_state = "normal" if can_analyze_now else "disabled"
+
+        # Export All button logic - Enabled if *any* raw data is loaded
+        export_all_state = "normal" if any_raw_data_loaded else "disabled"
+
+        # Prediction button/slider logic (depends on single analysis completion)
+        data_processed_for_target = (self._disease_data_ready and self.current_target_col_name is not None
+                                     and not self._processed_stale)
+        predict_state_tk = "normal" if data_processed_for_target else "disabled"
+
+        # Snapshot of what was just computed, so status messages don't re-query Tk
+        self._state_cache = {'disease': disease, 'country': country, 'target': target,
+                             'analyze_enabled': bool(self.analyze_button) and can_analyze_now}
+
+        # Apply states to Buttons only if state has changed
+        if self.analyze_button:
+             self._apply_widget_options(self.analyze_button, state=analyze_state)
+        if self.export_all_button:
+             self._apply_widget_options(self.export_all_button, state=export_all_state)
+
+        # Apply states to Prediction View components
+        if "prediction" in self.view_frames:
+             pred_view = self.view_frames["prediction"]
+             pred_button = pred_view.get_predict_button()
+             pred_slider = pred_view.get_slider()
+             if pred_button: # GlowButton state is 'normal' or 'disabled'
+                 self._apply_widget_options(pred_button, state=predict_state_tk)
+             if pred_slider:
+                 self._apply_widget_options(pred_slider, state=predict_state_tk)
+
+    def _disable_controls_after_ui_error(self, error):
+        """Fallback when a refresh fails: report it and leave only the disease selector usable."""
+        print(f"CRITICAL ERROR in _update_ui_element_states: {error}")
+        traceback.print_exc()
+        if self.status_bar:
+            self.status_bar.set_status(f"UI Update Error. Check console.")
+        
+        # Attempt to disable most interactive controls to indicate an error state
+        controls_to_disable_on_error = [
+            self.country_combobox, self.target_combobox,
+            self.analyze_button, self.export_all_button, self.load_button 
+        ]
+        if "prediction" in self.view_frames:
+            pred_view = self.view_frames["prediction"]
+            if hasattr(pred_view, 'get_predict_button') and pred_view.get_predict_button():
+                controls_to_disable_on_error.append(pred_view.get_predict_button())
+            if hasattr(pred_view, 'get_slider') and pred_view.get_slider():
+                controls_to_disable_on_error.append(pred_view.get_slider())
+
+        # Queued in the open batch and diffed on flush: controls already disabled cost no Tk call,
+        # and a destroyed control's TclError is handled per widget by _end_widget_batch
+        for control in controls_to_disable_on_error:
+            if control:
+                self._apply_widget_options(control, state='disabled')
+        # Ensure disease combobox is usable to allow user to try selecting another option
+        if self.disease_combobox:
+            self._apply_widget_options(self.disease_combobox, state='readonly')
+
 
     def clear_statistics(self):
         """Clears statistics display on the dashboard and resets risk."""
         if "dashboard" in self.view_frames:
             self.view_frames["dashboard"].clear_stats() # Calls method in DashboardView
-        if self.status_bar:
-            self.status_bar.set_risk("Unknown") # Reset risk level
+        self._notify(risk="Unknown") # Reset risk level
 
     def clear_all_view_content(self):
         """Clears plot frames in Analysis and Prediction views and adds placeholders."""
@@ -811,70 +1080,98 @@ class DarkThemedDiseaseApp:
              return
 
         # Check if data is already loaded
-        already_loaded = False
-        if disease == "COVID-19" and self.raw_covid_data is not None: already_loaded=True
-        elif disease == "Grippe" and self.raw_influenza_data is not None: already_loaded=True
-        elif disease == "Zika" and self.raw_zika_data is not None: already_loaded=True
+        already_loaded = self._raw_data_for(disease) is not None
 
         if already_loaded:
              status_msg=f"{disease} data already loaded. Select Country/Target and Analyze or Export."
-             if self.status_bar: self.status_bar.set_status(status_msg)
-             if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg)
+             self._notify(status=status_msg, dashboard=status_msg)
              self._update_ui_element_states()
              return
 
         # --- Start Loading Thread ---
         status_msg_loading = f"Loading data for {disease}..."
-        if self.status_bar: self.status_bar.set_status(status_msg_loading)
-        if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg_loading)
+        self._notify(status=status_msg_loading, dashboard=status_msg_loading)
         self._set_ui_busy(True, "Loading")
 
         # Reset stores
         self.disease_data = None
         self.current_target_col_name = None
-        if disease == "COVID-19":
-            self.raw_covid_data = None
-            self.allowed_covid_countries_in_data = []
-        elif disease == "Grippe":
-            self.raw_influenza_data = None
-            self.allowed_influenza_countries_in_data = []
-        elif disease == "Zika":
-            self.raw_zika_data = None
-            self.allowed_zika_countries_in_data = []
+        self._reset_raw_data(disease)
         self.selected_country.set("Select Country")
         self.selected_target.set(config.DEFAULT_ANALYSIS_TARGET)
 
-        thread = threading.Thread(target=self._data_loading_thread_target, daemon=True)
-        thread.start()
+        self._queue_data_load(disease)
+
+
+    def _queue_data_load(self, disease):
+        """Hands a load to the single loader thread, cancelling any load still pending or running."""
+        self._load_cancel.set() # Supersede the previous request
+        self._load_cancel = threading.Event()
+        self._load_jobs.put((disease, self._load_cancel))
 
+    def _load_worker_loop(self):
+        """Runs queued data loads one at a time; loads superseded while waiting are skipped."""
+        while True:
+            disease, cancel_token = self._load_jobs.get()
+            if cancel_token.is_set():
+                print(f"--- [Loader] Skipping superseded load for {disease} ---")
+                continue
+            self._data_loading_thread_target(disease, cancel_token)
+
+    def _run_in_background(self, func, *args):
+        """Queues func(*args) on the persistent task worker instead of starting a thread per task."""
+        self._task_jobs.put((func, args))
+
+    def _post_status(self, message):
+        """Thread-safe progress message for the status bar; only the newest one per poll is shown."""
+        self._status_q.put(message)
+
+    def _drain_status_queue(self):
+        """Main-thread poller: applies the latest queued progress message, then reschedules itself."""
+        latest = None
+        try:
+            while True: latest = self._status_q.get_nowait()
+        except queue.Empty: pass
+        # Once the task has finished (_set_ui_busy(False)), its completion status wins over late progress
+        if latest is not None and self._ui_busy and self.status_bar:
+            self.status_bar.set_status(latest)
+        self.root.after(config.STATUS_POLL_MS, self._drain_status_queue)
+
+    def _task_worker_loop(self):
+        """Runs queued processing/prediction/export tasks one at a time (the UI is busy meanwhile)."""
+        while True:
+            func, args = self._task_jobs.get()
+            try:
+                func(*args)
+            except Exception as e: # Thread targets report their own errors; keep the worker alive regardless
+                print(f"--- [Task Worker] Unhandled error in {func.__name__}: {e} ---"); traceback.print_exc()
 
-    def _data_loading_thread_target(self):
+    def _data_loading_thread_target(self, disease, cancel_token):
         """
         Worker thread for loading RAW data based on selected disease.
-        (Remains the same, called by on_disease_change)
+        (Called from the loader thread; see _queue_data_load)
         """
         raw_data_temp = None
         processed_data_sim = None
         success = False
         error_message = None
-        disease = self.current_disease.get()
         is_simulation = False
 
         try:
             print(f"--- [Thread] Starting Data Load for {disease} ---")
             raw_data_temp = data_loader.get_data_source(disease)
+            if cancel_token.is_set(): # A newer selection arrived while reading; don't touch shared state
+                print(f"--- [Thread] Load for {disease} superseded, discarding result ---")
+                return
 
             if raw_data_temp is None:
                  raise ValueError(f"Data loading function failed to return data for {disease}.")
-
             if disease == "COVID-19":
                 if raw_data_temp.empty: raise ValueError("Loaded COVID data is empty.")
                 self.raw_covid_data = raw_data_temp
                 if 'country' not in self.raw_covid_data.columns: raise ValueError("'country' column missing.")
-                all_countries_in_file = sorted(self.raw_covid_data['country'].dropna().unique())
-                self.allowed_covid_countries_in_data = [
-                    c for c in all_countries_in_file if c in config.ALLOWED_COVID_COUNTRIES
-                ]
+                all_countries_in_file = _distinct_countries(self.raw_covid_data['country'])
+                self.allowed_covid_countries_in_data = sorted(_ALLOWED_COVID_SET.intersection(all_countries_in_file))
                 if not self.allowed_covid_countries_in_data:
                     print("[Warning] No countries in loaded COVID data match ALLOWED_COVID_COUNTRIES.")
                     if not config.ALLOWED_COVID_COUNTRIES and all_countries_in_file:
@@ -883,6 +1180,7 @@ class DarkThemedDiseaseApp:
                     elif not all_countries_in_file: print("[Warning] No countries found in COVID data file.")
                     else: self.allowed_covid_countries_in_data = []
                 print(f"[COVID Load Thread] Allowed Countries: {self.allowed_covid_countries_in_data}");
+                self._index_raw_countries(disease)
                 success = True
 
             elif disease == "Grippe":
@@ -890,9 +1188,10 @@ class DarkThemedDiseaseApp:
                  self.raw_influenza_data = raw_data_temp;
                  country_col = config.GRIPPE_RAW_COUNTRY_COL
                  if country_col not in self.raw_influenza_data.columns: raise ValueError(f"Raw country column '{country_col}' missing.");
-                 self.allowed_influenza_countries_in_data = sorted(self.raw_influenza_data[country_col].dropna().astype(str).unique())
+                 self.allowed_influenza_countries_in_data = _distinct_countries(self.raw_influenza_data[country_col])
                  if not self.allowed_influenza_countries_in_data: print("[Warning] No countries found in Influenza data.")
                  print(f"[Influenza Load Thread] Countries Found: {self.allowed_influenza_countries_in_data}");
+                 self._index_raw_countries(disease)
                  success = True
 
             elif disease == "Zika":
@@ -900,9 +1199,10 @@ class DarkThemedDiseaseApp:
                  self.raw_zika_data = raw_data_temp;
                  country_col = config.ZIKA_COUNTRY_COL
                  if country_col not in self.raw_zika_data.columns: raise ValueError(f"Raw country column '{country_col}' missing.");
-                 self.allowed_zika_countries_in_data = sorted(self.raw_zika_data[country_col].dropna().astype(str).unique())
+                 self.allowed_zika_countries_in_data = _distinct_countries(self.raw_zika_data[country_col])
                  if not self.allowed_zika_countries_in_data: print("[Warning] No countries found in Zika data.")
                  print(f"[Zika Load Thread] Countries Found: {self.allowed_zika_countries_in_data}");
+                 self._index_raw_countries(disease)
                  success = True
 
             else: # Simulated/Other - process immediately for 'Cases'
@@ -923,23 +1223,28 @@ class DarkThemedDiseaseApp:
         except Exception as e:
             error_message = f"Data Load Error ({disease}): {str(e)}"
             print(f"--- [Thread] {error_message} ---"); traceback.print_exc();
-            if disease == "COVID-19": self.raw_covid_data = None; self.allowed_covid_countries_in_data = []
-            elif disease == "Grippe": self.raw_influenza_data = None; self.allowed_influenza_countries_in_data = []
-            elif disease == "Zika": self.raw_zika_data = None; self.allowed_zika_countries_in_data = []
+            if cancel_token.is_set(): return # Superseded; the newer load owns the shared state
+            self._reset_raw_data(disease)
             self.disease_data = None; self.current_target_col_name = None
             success = False
         finally:
-             # Schedule UI update on main thread
-             self.root.after(0, self._data_load_complete, success, is_simulation, error_message)
+             # Schedule UI update on main thread (unless a newer load has taken over)
+             if not cancel_token.is_set():
+                 self.root.after_idle(self._data_load_complete, success, is_simulation, error_message)
 
 
     def _data_load_complete(self, success, is_simulation, error_message=None):
-        """Handles UI updates after the data loading thread finishes."""
-        self._set_ui_busy(False) # Re-enable UI first. This also calls _update_ui_element_states().
+        """Handles UI updates after the data loading thread finishes.
+
+        Scheduled once via after_idle and applies every UI effect of the load, so Tk redraws in a single pass.
+        """
+        self._refresh_valid_countries() # The loader thread may have replaced an allowed-countries list
+        self._set_ui_busy(False) # Re-enable UI first. This also schedules _update_ui_element_states().
         disease = self.current_disease.get()
 
         # Check if _update_ui_element_states (called via _set_ui_busy) already reported an error
         ui_error_detected = False
+        self._flush_notify() # Read back the applied status, not one still queued
         if self.status_bar:
             current_status = self.status_bar.status_var.get()
             if "UI Update Error" in current_status:
@@ -947,16 +1252,15 @@ class DarkThemedDiseaseApp:
                 print(f"[DataLoadComplete] Detected UI update error from earlier step. Status: '{current_status}'")
 
         if success:
-            if self.status_bar: self.status_bar.set_progress(100)
+            analysis.clear_figure_cache() # Fresh data: drop figures built from the old load (main thread owns the cache)
+            self._notify(progress=100)
 
             if not ui_error_detected: # Only proceed with normal status updates if no UI error was previously set
                 if not is_simulation:
                     # Raw data loaded (COVID/Grippe/Zika), UI states should be updated by _set_ui_busy.
                     # Now, set the appropriate status message.
                     status_msg = f"{disease} data loaded. "
-                    countries_available = (disease == "COVID-19" and self.allowed_covid_countries_in_data) or \
-                                          (disease == "Grippe" and self.allowed_influenza_countries_in_data) or \
-                                          (disease == "Zika" and self.allowed_zika_countries_in_data)
+                    countries_available = self._allowed_countries_for(disease)
                     if countries_available:
                          status_msg += "Select Country"
                          if disease == "COVID-19": # Only COVID supports target selection
@@ -964,20 +1268,12 @@ class DarkThemedDiseaseApp:
                          status_msg += ", then Analyze. Or 'Export Cleaned'."
                     else:
                          status_msg += "No valid countries found/allowed!"
-                    if self.status_bar:
-                        self.status_bar.set_status(status_msg)
-                        self.root.update_idletasks() # Force UI update for status bar
-                    if "dashboard" in self.view_frames:
-                        self.view_frames["dashboard"].update_status(status_msg)
+                    self._notify(status=status_msg, dashboard=status_msg)
 
                 else: # Simulation loaded AND processed (always 'Cases')
                     source_type="Simulated"
                     status_msg = f"Data ready: {disease} ({source_type}, Target: Cases). Analyzing..."
-                    if self.status_bar:
-                        self.status_bar.set_status(status_msg)
-                        self.root.update_idletasks() # Force UI update for status bar
-                    if "dashboard" in self.view_frames:
-                        self.view_frames["dashboard"].update_status(status_msg)
+                    self._notify(status=status_msg, dashboard=status_msg)
                     # UI states should be updated by _set_ui_busy.
                     # Run analysis automatically for the processed 'Cases' data
                     self.root.after(10, self.analyze_data, self.current_target_col_name)
@@ -985,12 +1281,7 @@ class DarkThemedDiseaseApp:
 
         else: # Loading Failed
             error_msg_full = error_message or f"Unknown loading error for {disease}."
-            if self.status_bar:
-                self.status_bar.set_progress(0)
-                self.status_bar.set_status(error_msg_full)
-                self.root.update_idletasks() # Force UI update for status bar
-            if "dashboard" in self.view_frames:
-                self.view_frames["dashboard"].update_status(f"Error: {error_msg_full}")
+            self._notify(status=error_msg_full, progress=0, dashboard=f"Error: {error_msg_full}")
             self.clear_all_view_content()
             self.clear_statistics()
             # _update_ui_element_states() was already called by _set_ui_busy(False) to reflect the reset data state.
@@ -1011,6 +1302,9 @@ class DarkThemedDiseaseApp:
         Processes raw data for the selected target and then runs analysis.
         (Assumes raw data is already loaded due to auto-load workflow).
         """
+        # A target/country change still inside its debounce window would otherwise fire after
+        # processing and mark the fresh data stale (or clear it)
+        self._flush_debounced('country', 'target')
         disease = self.current_disease.get()
         selected_country = self.selected_country.get()
         selected_target_type = self.selected_target.get() # "Cases" or "Deaths"
@@ -1019,10 +1313,10 @@ class DarkThemedDiseaseApp:
         if disease == "Select Disease":
              if self.status_bar: self.status_bar.set_status("Please select a disease first.")
              return
-        if disease in ["COVID-19", "Grippe", "Zika"] and selected_country == "Select Country":
+        if disease in self._DISEASE_DATA_ATTRS and selected_country == "Select Country":
              if self.status_bar: self.status_bar.set_status(f"Please select a country for {disease} first.")
              return
-        if disease == "COVID-19" and selected_target_type not in config.ANALYSIS_TARGETS:
+        if disease == "COVID-19" and selected_target_type not in config.ANALYSIS_TARGETS_SET:
              if self.status_bar: self.status_bar.set_status(f"Please select a valid target (Cases/Deaths) for {disease}.")
              return
 
@@ -1037,12 +1331,9 @@ class DarkThemedDiseaseApp:
 
         # --- Processing Logic ---
         # Check if raw data exists (should be loaded by auto-load)
-        raw_data = None
-        if disease == "COVID-19": raw_data = self.raw_covid_data
-        elif disease == "Grippe": raw_data = self.raw_influenza_data
-        elif disease == "Zika": raw_data = self.raw_zika_data
-        elif disease in config.AVAILABLE_DISEASES: # Simulated data
-             if self.disease_data is not None and not self.disease_data.empty:
+        raw_data = self._raw_data_for(disease)
+        if disease not in self._DISEASE_DATA_ATTRS and disease in config.AVAILABLE_DISEASES_SET: # Simulated data
+             if self._disease_data_ready:
                  print(f"[Analyze Trigger] Analyzing already processed SIMULATED data for {disease}")
                  self.analyze_data(target_col_name=self.current_target_col_name) # Run analysis directly
                  return
@@ -1053,115 +1344,76 @@ class DarkThemedDiseaseApp:
         if raw_data is None:
             # This case is less likely now with auto-load, but good failsafe
             status_msg=f"{disease} raw data not loaded. Select disease again."
-            if self.status_bar: self.status_bar.set_status(status_msg)
-            if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(f"Action Required: {status_msg}")
+            self._notify(status=status_msg, dashboard=f"Action Required: {status_msg}")
             return
 
         # --- Start Processing Thread ---
         status_msg_proc = f"Processing {disease} data for {selected_country} ({selected_target_type})...";
-        if self.status_bar: self.status_bar.set_status(status_msg_proc)
-        if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg_proc)
+        self._notify(status=status_msg_proc, dashboard=status_msg_proc)
         self._set_ui_busy(True, "Processing")
         self.disease_data = None # Clear previous *single* processed data
+        self._processed_stale = False
         self.current_target_col_name = None # Reset current target name
 
-        target_thread_func = self._processing_covid_thread_target if disease == "COVID-19" else \
-                             self._processing_influenza_thread_target if disease == "Grippe" else \
-                             self._processing_zika_thread_target
-        thread = threading.Thread(target=target_thread_func, args=(selected_country, selected_target_type), daemon=True)
-        thread.start()
-
-
-    def _processing_covid_thread_target(self, selected_country, target_type):
-        """Processes SINGLE COVID country/target in a thread (for Analyze button)."""
-        # (This function remains the same as in the previous 'Export All' version)
-        processed_df_country = None
-        target_col_name_out = None
-        try:
-            print(f"--- [Thread] Starting SINGLE COVID Processing for {selected_country} ({target_type}) ---")
-            processed_df_country = processing.preprocess_covid_data(self.raw_covid_data, selected_country, target_type)
-            if processed_df_country is None or processed_df_country.empty:
-                raise ValueError(f"COVID Preprocessing returned empty/None for {selected_country} ({target_type}).")
-
-            target_col_name_out = config.PREDICTION_CASES_TARGET_COL if target_type == "Cases" else config.PREDICTION_DEATHS_TARGET_COL
-            if target_col_name_out not in processed_df_country.columns:
-                 raise ValueError(f"Expected target column '{target_col_name_out}' not found after preprocess_covid_data.")
-
-            final_processed_df = processing.common_post_processing(processed_df_country, target_col_name_out)
-            if final_processed_df is None or final_processed_df.empty:
-                raise ValueError(f"Common post-processing failed for COVID/{selected_country} ({target_type}).")
-
-            self.disease_data = final_processed_df # Assign to main attribute for single analysis
-            self.current_target_col_name = target_col_name_out # Store the processed target name
-
-            print(f"--- [Thread] SINGLE COVID Processing Complete for {selected_country} ({target_type}). Shape: {self.disease_data.shape} ---")
-            self.root.after(0, self._processing_complete, True, target_col_name_out, None) # Success for single processing
-
-        except Exception as e:
-            error_message = f"SINGLE COVID Proc Error ({selected_country}/{target_type}): {str(e)}"
-            print(f"--- [Thread] {error_message} ---"); traceback.print_exc()
-            self.disease_data = None
-            self.current_target_col_name = None
-            self.root.after(0, self._processing_complete, False, None, error_message) # Failure
-
-
-    def _processing_influenza_thread_target(self, selected_country, target_type):
-        """Processes SINGLE Influenza country in a thread (for Analyze button)."""
-        # (This function remains the same as in the previous 'Export All' version)
-        processed_df_country = None
-        target_col_name_out = config.PREDICTION_CASES_TARGET_COL
-        try:
-            print(f"--- [Thread] Starting SINGLE Influenza Processing for {selected_country} (Target: Cases) ---")
-            processed_df_country = processing.preprocess_influenza_data(self.raw_influenza_data, selected_country)
-            if processed_df_country is None or processed_df_country.empty:
-                raise ValueError(f"Influenza Preprocessing returned empty/None for {selected_country}.")
-            if target_col_name_out not in processed_df_country.columns:
-                 raise ValueError(f"Expected target column '{target_col_name_out}' not found after preprocess_influenza_data.")
-
-            final_processed_df = processing.common_post_processing(processed_df_country, target_col_name_out)
-            if final_processed_df is None or final_processed_df.empty:
-                raise ValueError(f"Common post-processing failed for Influenza/{selected_country}.")
+        self._run_in_background(self._processing_thread_target, disease, selected_country, selected_target_type)
 
-            self.disease_data = final_processed_df # Assign to main attribute for single analysis
-            self.current_target_col_name = target_col_name_out # Store 'cases'
 
-            print(f"--- [Thread] SINGLE Influenza Processing Complete for {selected_country}. Shape: {self.disease_data.shape} ---")
-            self.root.after(0, self._processing_complete, True, target_col_name_out, None) # Success
+    def _memoized_processing(self, disease, country, target_type, raw_data, build):
+        """Returns the processed frame for (disease, country, target), running build() only on a miss.
 
-        except Exception as e:
-            error_message = f"SINGLE Influenza Proc Error ({selected_country}): {str(e)}"
-            print(f"--- [Thread] {error_message} ---"); traceback.print_exc()
-            self.disease_data = None
-            self.current_target_col_name = None
-            self.root.after(0, self._processing_complete, False, None, error_message) # Failure
-
-
-    def _processing_zika_thread_target(self, selected_country, target_type):
-        """Processes SINGLE Zika country/target in a thread (for Analyze button)."""
-        processed_df_country = None
-        target_col_name_out = None
+        Entries are tied to the raw frame they were built from, so reloading a disease invalidates them.
+        """
+        key = (disease, country, target_type)
+        with self._processed_cache_lock:
+            hit = self._processed_cache.get(key)
+            if hit is not None and hit[0] is raw_data:
+                self._processed_cache.move_to_end(key)
+                print(f"[Processed Cache] Reusing {disease}/{country} ({target_type})")
+                return hit[1]
+        final_df = build()
+        if final_df is not None and not final_df.empty:
+            with self._processed_cache_lock:
+                self._processed_cache[key] = (raw_data, final_df)
+                self._processed_cache.move_to_end(key)
+                while len(self._processed_cache) > config.PROCESSED_MEMO_SIZE:
+                    self._processed_cache.popitem(last=False)
+        return final_df
+
+    # Real-data disease -> (log label, preprocess(raw rows, country, target type), has a Deaths target)
+    _PROCESSING_TABLE = {
+        "COVID-19": ("COVID", processing.preprocess_covid_data, True),
+        "Grippe": ("Influenza", lambda rows, country, target_type: processing.preprocess_influenza_data(rows, country), False),
+        "Zika": ("Zika", processing.preprocess_zika_data, True),
+    }
+
+    def _processing_thread_target(self, disease, selected_country, target_type):
+        """Processes SINGLE country/target of a real-data disease in a thread (for Analyze button)."""
+        label, preprocess, has_deaths = self._PROCESSING_TABLE[disease]
+        if not has_deaths: target_type = "Cases" # Influenza source has no deaths column
+        target_col_name_out = config.PREDICTION_CASES_TARGET_COL if target_type == "Cases" else config.PREDICTION_DEATHS_TARGET_COL
         try:
-            print(f"--- [Thread] Starting SINGLE Zika Processing for {selected_country} ({target_type}) ---")
-            processed_df_country = processing.preprocess_zika_data(self.raw_zika_data, selected_country, target_type)
-            if processed_df_country is None or processed_df_country.empty:
-                raise ValueError(f"Zika Preprocessing returned empty/None for {selected_country} ({target_type}).")
+            print(f"--- [Thread] Starting SINGLE {label} Processing for {selected_country} ({target_type}) ---")
 
-            target_col_name_out = config.PREDICTION_CASES_TARGET_COL if target_type == "Cases" else config.PREDICTION_DEATHS_TARGET_COL
-            if target_col_name_out not in processed_df_country.columns:
-                 raise ValueError(f"Expected target column '{target_col_name_out}' not found after preprocess_zika_data.")
+            def build():
+                processed_df_country = preprocess(self._raw_country_rows(disease, selected_country), selected_country, target_type)
+                if processed_df_country is None or processed_df_country.empty:
+                    raise ValueError(f"{label} Preprocessing returned empty/None for {selected_country} ({target_type}).")
+                if target_col_name_out not in processed_df_country.columns:
+                     raise ValueError(f"Expected target column '{target_col_name_out}' not found after {label} preprocessing.")
+                return processing.common_post_processing(processed_df_country, target_col_name_out)
 
-            final_processed_df = processing.common_post_processing(processed_df_country, target_col_name_out)
+            final_processed_df = self._memoized_processing(disease, selected_country, target_type, self._raw_data_for(disease), build)
             if final_processed_df is None or final_processed_df.empty:
-                raise ValueError(f"Common post-processing failed for Zika/{selected_country} ({target_type}).")
+                raise ValueError(f"Common post-processing failed for {label}/{selected_country} ({target_type}).")
 
             self.disease_data = final_processed_df # Assign to main attribute for single analysis
             self.current_target_col_name = target_col_name_out # Store the processed target name
 
-            print(f"--- [Thread] SINGLE Zika Processing Complete for {selected_country} ({target_type}). Shape: {self.disease_data.shape} ---")
-            self.root.after(0, self._processing_complete, True, target_col_name_out, None) # Success
+            print(f"--- [Thread] SINGLE {label} Processing Complete for {selected_country} ({target_type}). Shape: {self.disease_data.shape} ---")
+            self.root.after(0, self._processing_complete, True, target_col_name_out, None) # Success for single processing
 
         except Exception as e:
-            error_message = f"SINGLE Zika Proc Error ({selected_country}/{target_type}): {str(e)}"
+            error_message = f"SINGLE {label} Proc Error ({selected_country}/{target_type}): {str(e)}"
             print(f"--- [Thread] {error_message} ---"); traceback.print_exc()
             self.disease_data = None
             self.current_target_col_name = None
@@ -1184,8 +1436,7 @@ class DarkThemedDiseaseApp:
         else:
             target_type = self.selected_target.get() if processed_target_col_name is None else processed_target_col_name.capitalize()
             error_msg_full = error_message or f"Unknown processing error for {self.current_disease.get()}/{self.selected_country.get()} ({target_type})."
-            if self.status_bar: self.status_bar.set_progress(0); self.status_bar.set_status(error_msg_full)
-            if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(f"Error: {error_msg_full}")
+            self._notify(status=error_msg_full, progress=0, dashboard=f"Error: {error_msg_full}")
 
             self.clear_all_view_content()
             self.clear_statistics()
@@ -1207,7 +1458,7 @@ class DarkThemedDiseaseApp:
         target_type_label = target_col_name.capitalize()
         print(f"[Analyze Data] Triggered for target: {target_type_label}...")
 
-        if self.disease_data is None or self.disease_data.empty:
+        if not self._disease_data_ready:
             if self.status_bar: self.status_bar.set_status(f"No processed data available for {target_type_label} to analyze!")
             self._update_ui_element_states()
             return
@@ -1219,13 +1470,13 @@ class DarkThemedDiseaseApp:
              self._update_ui_element_states()
              return
 
-        if self.analyze_button: self.analyze_button.config(state="disabled")
+        if self.analyze_button: self._apply_widget_options(self.analyze_button, state="disabled")
         pred_button = None
         if "prediction" in self.view_frames:
             pred_view = self.view_frames["prediction"]
             if hasattr(pred_view, 'get_predict_button'):
                  pred_button = pred_view.get_predict_button()
-        if pred_button: pred_button.config(state="disabled")
+        if pred_button: self._apply_widget_options(pred_button, state="disabled")
 
         status_msg = f"Generating analysis charts for {target_type_label}..."
         if self.status_bar: self.status_bar.set_status(status_msg)
@@ -1238,7 +1489,7 @@ class DarkThemedDiseaseApp:
             if disease == "COVID-19": source_info = f" ({country})" if country != "Select Country" else ""
             elif disease == "Grippe": source_info = f" ({country} - Weekly Source)" if country != "Select Country" else ""
             elif disease == "Zika": source_info = f" ({country})" if country != "Select Country" else ""
-            elif disease in config.AVAILABLE_DISEASES: source_info = " (Simulated)"
+            elif disease in config.AVAILABLE_DISEASES_SET: source_info = " (Simulated)"
 
             fig = analysis.plot_analysis_charts(self.disease_data, disease, target_col_name, source_info)
 
@@ -1248,9 +1499,6 @@ class DarkThemedDiseaseApp:
                  if fig is None: raise ValueError(f"Analysis plot generation returned None for {target_type_label}.")
 
             target_frame = self.view_frames["analysis"].get_plot_frame()
-            # Préparation de la vue d'analyse avant changement pour éviter les problèmes d'affichage
-            self.root.update_idletasks()  # Force la mise à jour de l'interface avant changement
-            
             # Changement vers la vue d'analyse en premier
             self.show_view("analysis")
             
@@ -1265,24 +1513,20 @@ class DarkThemedDiseaseApp:
                     target_frame = self.view_frames["analysis"].get_plot_frame()
                     self._display_error_in_frame(target_frame, error_message)
                  except Exception as e_disp: print(f"Error displaying error in frame: {e_disp}")
-                 if self.status_bar: self.status_bar.set_status(error_message.replace('\n', ' '))
-                 if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(f"Error: {error_message.replace('\n', ' ')}")
+                 self._notify(status=error_message.replace('\n', ' '), dashboard=f"Error: {error_message.replace('\n', ' ')}")
                  self.clear_statistics()
-                 if fig and plt.fignum_exists(fig.number): plt.close(fig)
                  self.show_view("analysis")
             else: raise
 
         except Exception as e:
             error_message = f"Analysis Display Error ({target_type_label}): {str(e)}"
             print(error_message); traceback.print_exc()
-            if self.status_bar: self.status_bar.set_status(error_message)
-            if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(f"Error: {error_message}")
+            self._notify(status=error_message, dashboard=f"Error: {error_message}")
             try:
                 target_frame = self.view_frames["analysis"].get_plot_frame()
                 self._display_error_in_frame(target_frame, f"Plotting Error ({target_type_label}):\n{e}")
             except Exception as e_disp: print(f"Error displaying error in frame: {e_disp}")
             self.clear_statistics()
-            if fig and plt.fignum_exists(fig.number): plt.close(fig)
             self.show_view("analysis")
 
         finally:
@@ -1299,11 +1543,7 @@ class DarkThemedDiseaseApp:
             
             # Mise à jour des messages de statut
             status_msg = f"{target_type_label} analysis complete. View plot in Analysis tab. Ready to predict."
-            if self.status_bar: self.status_bar.set_status(status_msg)
-            if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg)
-            
-            # Forcer une mise à jour complète de l'interface pour s'assurer que tout s'affiche correctement
-            self.root.update_idletasks()
+            self._notify(status=status_msg, dashboard=status_msg)
             
         except Exception as e:
             error_message = f"Analysis Display Error (delayed): {str(e)}"
@@ -1324,9 +1564,9 @@ class DarkThemedDiseaseApp:
         if not dashboard_view: return
 
         dashboard_view.clear_stats()
-        if self.status_bar: self.status_bar.set_risk("Unknown")
+        self._notify(risk="Unknown")
 
-        if self.disease_data is None or self.disease_data.empty:
+        if not self._disease_data_ready:
             print(f"[UI] No processed data for {target_type_label} stats.")
             dashboard_view.update_status(f"No data processed for {target_type_label} statistics.")
             return
@@ -1338,7 +1578,7 @@ class DarkThemedDiseaseApp:
              return
 
         try:
-            stats_dict = analysis.calculate_analysis_stats(self.disease_data, target_col_name)
+            stats_dict = self._analysis_stats(target_col_name) # Already computed when the data was processed
 
             if "error" in stats_dict:
                 self._display_error_in_stats(stats_dict["error"])
@@ -1362,13 +1602,16 @@ class DarkThemedDiseaseApp:
 
     def start_prediction(self):
         """Initiates the prediction process for the currently processed SINGLE target/country."""
-        # (Remains the same)
-        if self.disease_data is None or self.disease_data.empty:
+        self._flush_debounced('country', 'target') # Settle selections before checking _processed_stale
+        if not self._disease_data_ready:
             if self.status_bar: self.status_bar.set_status("No processed data available. Analyze first.")
             return
         if self.current_target_col_name is None:
              if self.status_bar: self.status_bar.set_status("Error: Target for processed data is unknown. Analyze first.")
              return
+        if self._processed_stale:
+             if self.status_bar: self.status_bar.set_status(f"Target changed to {self.selected_target.get()}. Analyze first.")
+             return
 
         target_type_label = self.current_target_col_name.capitalize()
         disease = self.current_disease.get()
@@ -1379,9 +1622,7 @@ class DarkThemedDiseaseApp:
         self.model = None
         self.scaler_X = None
 
-        thread = threading.Thread(target=self._prediction_thread_target,
-                                  args=(self.current_target_col_name,), daemon=True)
-        thread.start()
+        self._run_in_background(self._prediction_thread_target, self.current_target_col_name)
 
 
     def _prediction_thread_target(self, target_col_name):
@@ -1396,7 +1637,7 @@ class DarkThemedDiseaseApp:
         num_days_to_predict = self.prediction_days.get()
 
         try:
-            if self.disease_data is None or self.disease_data.empty:
+            if not self._disease_data_ready:
                 raise ValueError(f"Cannot train model for {target_type_label}, processed data missing.")
             if target_col_name not in self.disease_data.columns:
                 raise ValueError(f"Target column '{target_col_name}' not found in processed data for training.")
@@ -1406,13 +1647,13 @@ class DarkThemedDiseaseApp:
                       "Results may be less reliable.")
 
             status_update_train = f"Training prediction model for {target_type_label}..."
-            self.root.after(0, lambda: self.status_bar.set_status(status_update_train) if self.status_bar else None)
+            self._post_status(status_update_train)
 
             model, scaler = prediction.train_prediction_model(self.disease_data, target_col_name)
             self.model, self.scaler_X = model, scaler
 
             status_update_gen = f"Generating {target_type_label} forecast..."
-            self.root.after(0, lambda: self.status_bar.set_status(status_update_gen) if self.status_bar else None)
+            self._post_status(status_update_gen)
 
             last_hist_date_ts = self.disease_data['date'].iloc[-1] if not self.disease_data.empty else pd.Timestamp.now()
             prediction_df = prediction.generate_predictions(self.model, self.scaler_X, num_days_to_predict, last_hist_date_ts, target_col_name)
@@ -1441,8 +1682,6 @@ class DarkThemedDiseaseApp:
         except Exception as e:
             error_message = f"Prediction Error ({disease}/{target_type_label}): {str(e)}"
             print(f"--- [Thread] {error_message} ---"); traceback.print_exc()
-            if fig_pred and plt.fignum_exists(fig_pred.number):
-                 plt.close(fig_pred)
             self.root.after(0, self._prediction_complete, False, None, None, target_col_name, error_message) # Failure
 
 
@@ -1460,9 +1699,6 @@ class DarkThemedDiseaseApp:
             status_msg = f"{target_type_label} prediction complete. View forecast in Prediction tab."
             target_frame = pred_view.get_plot_frame()
             
-            # Préparation de la vue de prédiction avant changement pour éviter les problèmes d'affichage
-            self.root.update_idletasks()  # Force la mise à jour de l'interface avant changement
-            
             # Changement vers la vue de prédiction en premier
             self.show_view("prediction")
             
@@ -1471,8 +1707,7 @@ class DarkThemedDiseaseApp:
             
         else:
             status_msg = error_message or f"Unknown prediction error for {self.current_disease.get()} ({target_type_label})."
-            if self.status_bar: self.status_bar.set_progress(0); self.status_bar.set_status(status_msg)
-            if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(f"Error: {status_msg}")
+            self._notify(status=status_msg, progress=0, dashboard=f"Error: {status_msg}")
 
             target_frame = pred_view.get_plot_frame()
             self._display_error_in_frame(target_frame, f"Prediction Error ({target_type_label}):\n{status_msg}")
@@ -1498,8 +1733,7 @@ class DarkThemedDiseaseApp:
             self._display_prediction_statistics(stats_dict, target_col_name)
             
             # Mise à jour des messages de statut
-            if self.status_bar: self.status_bar.set_progress(100); self.status_bar.set_status(status_msg)
-            if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg)
+            self._notify(status=status_msg, progress=100, dashboard=status_msg)
             
             # Mise à jour des états UI
             self._update_ui_element_states()
@@ -1507,9 +1741,6 @@ class DarkThemedDiseaseApp:
             self._update_combobox_color(widget=self.country_combobox)
             self._update_combobox_color(widget=self.target_combobox)
             
-            # Force la mise à jour de l'interface après affichage
-            self.root.update_idletasks()
-            
             if self.status_bar:
                 self.root.after(1000, lambda: self.status_bar.set_progress(0) if self.status_bar else None)
         except Exception as e:
@@ -1526,6 +1757,7 @@ class DarkThemedDiseaseApp:
         if not stats_dict or "error" in stats_dict:
             err = stats_dict.get("error", f"No valid {target_type_label} prediction stats.") if isinstance(stats_dict, dict) else "Stats error"
             print(f"[UI] {err}")
+            self._flush_notify() # The suffix is appended to the applied status
             if self.status_bar:
                  current_status_base = self.status_bar.status_var.get().split('|')[0].strip()
                  self.status_bar.set_status(f"{current_status_base} | Forecast Stats Error")
@@ -1536,14 +1768,24 @@ class DarkThemedDiseaseApp:
         period_info = stats_dict.get('period_days_fmt', '')
         status_suffix = f"| Forecast {target_type_label} -> Peak: {peak_info}, Avg: {avg_info} ({period_info})"
 
+        self._flush_notify() # The suffix is appended to the applied status
         if self.status_bar:
             current_status = self.status_bar.status_var.get().split('|')[0].strip()
             self.status_bar.set_status(f"{current_status} {status_suffix}")
 
     # --- Figure Embedding / Error Display ---
     def _embed_figure(self, fig, parent_widget):
-        """Embeds a Matplotlib figure into a Tkinter frame."""
-        # (Remains the same)
+        """Embeds a Matplotlib figure into a Tkinter frame (reusing the canvas if that figure is already shown there)."""
+        embedded = self._embedded.pop(parent_widget, None)
+        if fig is not None and embedded and embedded[0] is fig:
+            try:
+                if embedded[1].get_tk_widget().winfo_exists(): # Not destroyed by a placeholder/error since
+                    self.canvas, self.toolbar = embedded[1], embedded[2]
+                    self._embedded[parent_widget] = embedded
+                    if fig.stale: self.canvas.draw_idle() # Recycled figure redrawn with new content
+                    return
+            except tk.TclError: pass
+
         for widget in parent_widget.winfo_children(): widget.destroy()
         self.canvas = None; self.toolbar = None
 
@@ -1569,13 +1811,13 @@ class DarkThemedDiseaseApp:
             parent_widget.grid_rowconfigure(0, weight=1); parent_widget.grid_rowconfigure(1, weight=0)
             parent_widget.grid_columnconfigure(0, weight=1)
 
-            parent_widget.update_idletasks()
+            # draw_idle renders once after the pending grid/<Configure> work, coalescing the resize redraw
             self.canvas.draw_idle()
+            self._embedded[parent_widget] = (fig, self.canvas, self.toolbar)
 
         except Exception as e:
             print(f"Error embedding figure: {e}"); traceback.print_exc()
             self._display_error_in_frame(parent_widget, f"Error displaying plot:\n{e}")
-            if fig and plt.fignum_exists(fig.number): plt.close(fig)
             self.canvas = None; self.toolbar = None
 
     def _display_error_in_frame(self, parent_frame, error_message):
@@ -1601,12 +1843,57 @@ class DarkThemedDiseaseApp:
             return
 
         status_msg = "Starting export of all cleaned data..."
-        if self.status_bar: self.status_bar.set_status(status_msg)
-        if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(status_msg)
+        self._notify(status=status_msg, dashboard=status_msg)
         self._set_ui_busy(True, "Exporting All Data")
 
-        thread = threading.Thread(target=self._export_all_cleaned_data_thread_target, daemon=True)
-        thread.start()
+        self._run_in_background(self._export_all_cleaned_data_thread_target)
+
+    def _clean_all_countries(self, disease, *target_types):
+        """
+        Preprocesses every allowed country of a real-data disease for Export Cleaned, several
+        countries at a time (pandas/NumPy release the GIL in their kernels). Each country's raw
+        rows are sliced once and shared by all requested targets.
+        Returns ({target type: cleaned frames in country order}, whether anything failed).
+        """
+        label, preprocess, _ = self._PROCESSING_TABLE[disease]
+        status_name = f"{'COVID' if disease == 'COVID-19' else disease} {' & '.join(target_types)}"
+        countries = self._allowed_countries_for(disease)
+        total = len(countries)
+
+        def clean(country):
+            """(target type, cleaned frame or None, error or None) per target for one country."""
+            rows = self._raw_country_rows(disease, country)
+            outcomes = []
+            for target_type in target_types:
+                print(f"[Export Thread] {label} {target_type} - Processing: {country}")
+                try:
+                    outcomes.append((target_type, preprocess(rows, country, target_type), None))
+                except Exception as e:
+                    outcomes.append((target_type, None, e))
+            return outcomes
+
+        print(f"[Export Thread] Processing {label} {' & '.join(target_types)}...")
+        self._post_status(f"Processing {status_name} (0/{total})...")
+        cleaned = {target_type: [None] * total for target_type in target_types} # By position: keeps country order
+        errors_occurred = False
+        with concurrent.futures.ThreadPoolExecutor(max_workers=config.EXPORT_WORKERS, thread_name_prefix="export") as pool:
+            futures = {pool.submit(clean, country): i for i, country in enumerate(countries)}
+            for done, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+                i = futures[future]
+                country = countries[i]
+                for target_type, df_clean, error in future.result():
+                    if error is not None:
+                        print(f"[Export Thread] ERROR processing {label} {target_type} for {country}: {error}")
+                        errors_occurred = True # Mark that an error happened
+                    elif df_clean is not None and not df_clean.empty:
+                        df_clean['country'] = country # Add country column back
+                        cleaned[target_type][i] = df_clean
+                    else:
+                        print(f"[Export Thread] Warning: No {label} {target_type} data after cleaning for {country}.")
+                if done % 5 == 0 or done == total:
+                    self._post_status(f"Processing {status_name} ({done}/{total}: {country})...")
+        print(f"[Export Thread] Finished processing {label} {' & '.join(target_types)}.")
+        return {target_type: [df for df in frames if df is not None] for target_type, frames in cleaned.items()}, errors_occurred
 
     def _export_all_cleaned_data_thread_target(self):
         """
@@ -1623,133 +1910,28 @@ class DarkThemedDiseaseApp:
 
         # --- Process COVID-19 Data ---
         if self.raw_covid_data is not None and self.allowed_covid_countries_in_data:
-            total_covid_countries = len(self.allowed_covid_countries_in_data)
-            print(f"[Export Thread] Processing {total_covid_countries} COVID-19 countries...")
-
-            # Process Cases
-            print("[Export Thread] Processing COVID-19 Cases...")
-            status_update = f"Processing COVID Cases (0/{total_covid_countries})..."
-            self.root.after(0, lambda: self.status_bar.set_status(status_update) if self.status_bar else None)
-            for i, country in enumerate(self.allowed_covid_countries_in_data):
-                try:
-                    if (i + 1) % 5 == 0 or i == total_covid_countries - 1:
-                         status_update = f"Processing COVID Cases ({i+1}/{total_covid_countries}: {country})..."
-                         self.root.after(0, lambda s=status_update: self.status_bar.set_status(s) if self.status_bar else None)
-
-                    print(f"[Export Thread] COVID Cases - Processing: {country}")
-                    df_clean = processing.preprocess_covid_data(self.raw_covid_data, country, target_type="Cases")
-                    if df_clean is not None and not df_clean.empty:
-                        df_clean['country'] = country # Add country column back
-                        all_cleaned_covid_cases_dfs.append(df_clean)
-                    else:
-                         print(f"[Export Thread] Warning: No COVID Cases data after cleaning for {country}.")
-                except Exception as e:
-                    print(f"[Export Thread] ERROR processing COVID Cases for {country}: {e}")
-                    errors_occurred = True # Mark that an error happened
-            print("[Export Thread] Finished processing COVID-19 Cases.")
-
-            # Process Deaths
-            print("[Export Thread] Processing COVID-19 Deaths...")
-            status_update = f"Processing COVID Deaths (0/{total_covid_countries})..."
-            self.root.after(0, lambda: self.status_bar.set_status(status_update) if self.status_bar else None)
-            for i, country in enumerate(self.allowed_covid_countries_in_data):
-                 try:
-                    if (i + 1) % 5 == 0 or i == total_covid_countries - 1:
-                         status_update = f"Processing COVID Deaths ({i+1}/{total_covid_countries}: {country})..."
-                         self.root.after(0, lambda s=status_update: self.status_bar.set_status(s) if self.status_bar else None)
-
-                    print(f"[Export Thread] COVID Deaths - Processing: {country}")
-                    df_clean = processing.preprocess_covid_data(self.raw_covid_data, country, target_type="Deaths")
-                    if df_clean is not None and not df_clean.empty:
-                        df_clean['country'] = country # Add country column back
-                        all_cleaned_covid_deaths_dfs.append(df_clean)
-                    else:
-                         print(f"[Export Thread] Warning: No COVID Deaths data after cleaning for {country}.")
-                 except Exception as e:
-                    print(f"[Export Thread] ERROR processing COVID Deaths for {country}: {e}")
-                    errors_occurred = True
-            print("[Export Thread] Finished processing COVID-19 Deaths.")
-
+            print(f"[Export Thread] Processing {len(self.allowed_covid_countries_in_data)} COVID-19 countries...")
+            cleaned, failed = self._clean_all_countries("COVID-19", "Cases", "Deaths")
+            all_cleaned_covid_cases_dfs, all_cleaned_covid_deaths_dfs = cleaned["Cases"], cleaned["Deaths"]
+            errors_occurred |= failed
         else:
             print("[Export Thread] No raw COVID-19 data loaded or no allowed countries found. Skipping COVID export.")
 
         # --- Process Grippe Data ---
         if self.raw_influenza_data is not None and self.allowed_influenza_countries_in_data:
-            total_grippe_countries = len(self.allowed_influenza_countries_in_data)
-            print(f"[Export Thread] Processing {total_grippe_countries} Grippe countries (Cases only)...")
-            status_update = f"Processing Grippe Cases (0/{total_grippe_countries})..."
-            self.root.after(0, lambda: self.status_bar.set_status(status_update) if self.status_bar else None)
-
-            for i, country in enumerate(self.allowed_influenza_countries_in_data):
-                try:
-                    if (i + 1) % 5 == 0 or i == total_grippe_countries - 1:
-                         status_update = f"Processing Grippe Cases ({i+1}/{total_grippe_countries}: {country})..."
-                         self.root.after(0, lambda s=status_update: self.status_bar.set_status(s) if self.status_bar else None)
-
-                    print(f"[Export Thread] Grippe Cases - Processing: {country}")
-                    df_clean = processing.preprocess_influenza_data(self.raw_influenza_data, country)
-                    if df_clean is not None and not df_clean.empty:
-                        df_clean['country'] = country # Add country column back
-                        all_cleaned_grippe_dfs.append(df_clean)
-                    else:
-                         print(f"[Export Thread] Warning: No Grippe data after cleaning for {country}.")
-                except Exception as e:
-                    print(f"[Export Thread] ERROR processing Grippe Cases for {country}: {e}")
-                    errors_occurred = True
-            print("[Export Thread] Finished processing Grippe Cases.")
+            print(f"[Export Thread] Processing {len(self.allowed_influenza_countries_in_data)} Grippe countries (Cases only)...")
+            cleaned, failed = self._clean_all_countries("Grippe", "Cases")
+            all_cleaned_grippe_dfs = cleaned["Cases"]
+            errors_occurred |= failed
         else:
             print("[Export Thread] No raw Grippe data loaded or no countries found. Skipping Grippe export.")
 
         # --- Process Zika Data ---
         if self.raw_zika_data is not None and self.allowed_zika_countries_in_data:
-            total_zika_countries = len(self.allowed_zika_countries_in_data)
-            print(f"[Export Thread] Processing {total_zika_countries} Zika countries...")
-            
-            # Process Cases
-            print("[Export Thread] Processing Zika Cases...")
-            status_update = f"Processing Zika Cases (0/{total_zika_countries})..."
-            self.root.after(0, lambda: self.status_bar.set_status(status_update) if self.status_bar else None)
-            
-            for i, country in enumerate(self.allowed_zika_countries_in_data):
-                try:
-                    if (i + 1) % 5 == 0 or i == total_zika_countries - 1:
-                         status_update = f"Processing Zika Cases ({i+1}/{total_zika_countries}: {country})..."
-                         self.root.after(0, lambda s=status_update: self.status_bar.set_status(s) if self.status_bar else None)
-
-                    print(f"[Export Thread] Zika Cases - Processing: {country}")
-                    df_clean = processing.preprocess_zika_data(self.raw_zika_data, country, target_type="Cases")
-                    if df_clean is not None and not df_clean.empty:
-                        df_clean['country'] = country # Add country column back
-                        all_cleaned_zika_cases_dfs.append(df_clean)
-                    else:
-                         print(f"[Export Thread] Warning: No Zika Cases data after cleaning for {country}.")
-                except Exception as e:
-                    print(f"[Export Thread] ERROR processing Zika Cases for {country}: {e}")
-                    errors_occurred = True
-            print("[Export Thread] Finished processing Zika Cases.")
-            
-            # Process Deaths
-            print("[Export Thread] Processing Zika Deaths...")
-            status_update = f"Processing Zika Deaths (0/{total_zika_countries})..."
-            self.root.after(0, lambda: self.status_bar.set_status(status_update) if self.status_bar else None)
-            
-            for i, country in enumerate(self.allowed_zika_countries_in_data):
-                try:
-                    if (i + 1) % 5 == 0 or i == total_zika_countries - 1:
-                         status_update = f"Processing Zika Deaths ({i+1}/{total_zika_countries}: {country})..."
-                         self.root.after(0, lambda s=status_update: self.status_bar.set_status(s) if self.status_bar else None)
-
-                    print(f"[Export Thread] Zika Deaths - Processing: {country}")
-                    df_clean = processing.preprocess_zika_data(self.raw_zika_data, country, target_type="Deaths")
-                    if df_clean is not None and not df_clean.empty:
-                        df_clean['country'] = country # Add country column back
-                        all_cleaned_zika_deaths_dfs.append(df_clean)
-                    else:
-                         print(f"[Export Thread] Warning: No Zika Deaths data after cleaning for {country}.")
-                except Exception as e:
-                    print(f"[Export Thread] ERROR processing Zika Deaths for {country}: {e}")
-                    errors_occurred = True
-            print("[Export Thread] Finished processing Zika Deaths.")
+            print(f"[Export Thread] Processing {len(self.allowed_zika_countries_in_data)} Zika countries...")
+            cleaned, failed = self._clean_all_countries("Zika", "Cases", "Deaths")
+            all_cleaned_zika_cases_dfs, all_cleaned_zika_deaths_dfs = cleaned["Cases"], cleaned["Deaths"]
+            errors_occurred |= failed
         else:
             print("[Export Thread] No raw Zika data loaded or no countries found. Skipping Zika export.")
 
@@ -1929,8 +2111,7 @@ class DarkThemedDiseaseApp:
              final_status = "Export finished. No files were saved (cancelled by user?)."
 
         print(f"[Save All] {final_status}")
-        if self.status_bar: self.status_bar.set_status(final_status)
-        if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(final_status)
+        self._notify(status=final_status, dashboard=final_status)
         self._set_ui_busy(False)
         if self.status_bar: self.status_bar.stop_progress(); self.status_bar.set_progress(0)
         self.root.after(5000, lambda: self.status_bar.set_status("Ready.") if self.status_bar and final_status in self.status_bar.status_var.get() else None)
@@ -1939,7 +2120,7 @@ class DarkThemedDiseaseApp:
 
     def _update_processed_data_statistics(self, target_col_name):
         """Updates dashboard statistics immediately after data processing with real values."""
-        if self.disease_data is None or self.disease_data.empty or target_col_name is None:
+        if not self._disease_data_ready or target_col_name is None:
             # Provide default values even if data is missing
             self._set_default_statistics()
             return
@@ -1950,7 +2131,7 @@ class DarkThemedDiseaseApp:
 
         try:
             # Calculate statistics from processed data
-            stats_dict = analysis.calculate_analysis_stats(self.disease_data, target_col_name)
+            stats_dict = self._analysis_stats(target_col_name)
             
             # Create a dashboard stats dictionary with guaranteed values
             dashboard_stats = {}
@@ -2037,12 +2218,12 @@ class DarkThemedDiseaseApp:
             is_busy (bool): True to enable busy state, False to restore normal state
             message (str, optional): Status message to display while busy
         """
+        self._ui_busy = is_busy
         try:
             if is_busy:
                 # 1. Show status message
                 if message:
-                    if self.status_bar: self.status_bar.set_status(message + "...")
-                    if "dashboard" in self.view_frames: self.view_frames["dashboard"].update_status(message + "...")
+                    self._notify(status=message + "...", dashboard=message + "...")
                 
                 # 2. Start progress bar animation
                 if self.status_bar: self.status_bar.start_progress()
@@ -2063,13 +2244,10 @@ class DarkThemedDiseaseApp:
                     if hasattr(pred_view, 'get_slider') and pred_view.get_slider():
                         controls_to_disable.append(pred_view.get_slider())
                 
-                for control in controls_to_disable:
-                    if control:
-                        try:
-                            if hasattr(control, 'config'):  # Most widgets
-                                control.config(state='disabled')
-                        except tk.TclError:
-                            pass  # Control might be destroyed or in bad state
+                with self._batched_widget_updates(): # TclErrors are handled per control on flush
+                    for control in controls_to_disable:
+                        if control and hasattr(control, 'config'):  # Most widgets
+                            self._apply_widget_options(control, state='disabled')
             else:
                 # 1. Stop progress bar animation
                 if self.status_bar: self.status_bar.stop_progress()
@@ -2135,6 +2313,9 @@ if __name__ == "__main__":
             except Exception as e_old_dpi: print(f"Could not set DPI awareness using older method: {e_old_dpi}")
         except Exception as e: print(f"DPI awareness setting failed (optional): {e}")
 
+    if config.PREFETCH_RAW_DATA:
+        data_loader.prefetch_all() # Parse the data files while the UI builds
+
     try:
         root = tk.Tk()
         app = DarkThemedDiseaseApp(root)
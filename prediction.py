@@ -3,7 +3,10 @@
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.artist import setp
+from matplotlib.figure import Figure
+from matplotlib.backend_bases import FigureCanvasBase
 import matplotlib.dates as mdates # Import mdates for better date formatting
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestRegressor
@@ -13,6 +16,40 @@ import calendar
 import config # Import configuration for colors and settings
 
 
+# --- Figure reuse ---
+# The prediction view only ever shows the latest chart, so two figures are
+# alternated: the next chart is drawn into the one that is not on screen.
+_prediction_figures = []
+_next_prediction_figure = 0
+
+
+def _new_prediction_axes():
+    """Returns (fig, ax) on a cleared pooled figure instead of creating a new one per forecast."""
+    global _next_prediction_figure
+    if len(_prediction_figures) < 2:
+        fig = Figure(figsize=(10, 6), dpi=100) # Use rcParams facecolor
+        _prediction_figures.append(fig)
+        _next_prediction_figure = len(_prediction_figures) % 2
+    else:
+        fig = _prediction_figures[_next_prediction_figure]
+        _next_prediction_figure = (_next_prediction_figure + 1) % 2
+        # Detach from its old Tk canvas first: that canvas and toolbar were destroyed when the
+        # other figure was embedded, and clf() would call the toolbar (from the worker thread)
+        FigureCanvasBase(fig)
+        fig.clf()
+        fig.set_dpi(100)
+        fig.set_size_inches(10, 6) # The embedding canvas may have resized it
+    return fig, fig.add_subplot(111)
+
+
+def _discard_prediction_figure(fig):
+    """Drops a figure from the pool (e.g. after a failed plot)."""
+    global _next_prediction_figure
+    if fig in _prediction_figures:
+        _prediction_figures.remove(fig)
+        _next_prediction_figure = len(_prediction_figures) % 2
+
+
 def train_prediction_model(df, target_col_name):
     """
     Trains a RandomForestRegressor model on historical data for the specified target column.
@@ -80,16 +117,14 @@ def generate_predictions(model, scaler, num_days, last_hist_date, target_col_nam
     prediction_start_date = last_hist_date.date() + timedelta(days=1)
     print(f"[Predict Generate] Using start date: {prediction_start_date}")
 
-    future_dates = [prediction_start_date + timedelta(days=i) for i in range(num_days)]
+    future_dates = pd.date_range(prediction_start_date, periods=num_days, freq='D')
     print(f"[Predict Generate] Predicting {target_type_label} for {num_days} days: "
-          f"{future_dates[0]} to {future_dates[-1]}")
+          f"{future_dates[0].date()} to {future_dates[-1].date()}")
 
-    # Create future features based on dates
-    future_features = []
-    for date in future_dates:
-        future_features.append(
-            [date.timetuple().tm_yday, date.month, date.day, date.weekday()]
-        )
+    # Future features from the whole date range at once (same order as config.PREDICTION_FEATURE_COLS)
+    future_features = np.column_stack(
+        [future_dates.dayofyear, future_dates.month, future_dates.day, future_dates.dayofweek]
+    )
 
     try:
         future_features_scaled = scaler.transform(future_features)
@@ -104,10 +139,9 @@ def generate_predictions(model, scaler, num_days, last_hist_date, target_col_nam
     # Create prediction DataFrame with a dynamic column name
     pred_col_name = f"predicted_{target_col_name}" # e.g., predicted_cases or predicted_deaths
     prediction_df = pd.DataFrame({
-        'date': future_dates,
+        'date': future_dates, # Already datetime64
         pred_col_name: predictions
     })
-    prediction_df['date'] = pd.to_datetime(prediction_df['date']) # Ensure datetime type
     print(f"[Predict Generate] {target_type_label} predictions generated.")
     return prediction_df
 
@@ -156,8 +190,7 @@ def plot_prediction_chart(hist_df, pred_df, disease_name, target_col_name, sourc
 
     fig = None # Initialize
     try:
-        fig = plt.figure(figsize=(10, 6), dpi=100) # Use rcParams facecolor
-        ax = fig.add_subplot(111)
+        fig, ax = _new_prediction_axes()
 
         # Select colors based on target
         colors = config.PLOT_COLORS_DARK
@@ -172,7 +205,7 @@ def plot_prediction_chart(hist_df, pred_df, disease_name, target_col_name, sourc
             pred_color = "#999999"
 
         line_color = colors["separator_lines"]
-        text_color = plt.rcParams['text.color']
+        text_color = matplotlib.rcParams['text.color']
 
         # Add note to title for long forecasts
         title = f'{disease_name} - {target_type_label} History & Forecast{source_info}'
@@ -239,7 +272,7 @@ def plot_prediction_chart(hist_df, pred_df, disease_name, target_col_name, sourc
             ax.xaxis.set_major_formatter(formatter)
         except Exception as e_fmt:
             print(f"[Predict Plot] Warning: Failed to apply auto date ticks: {e_fmt}")
-            plt.setp(ax.get_xticklabels(), rotation=30, ha='right')
+            setp(ax.get_xticklabels(), rotation=30, ha='right')
 
         # Set X Limits (Full Range - Robust handling)
         first_date_hist = None
@@ -294,16 +327,18 @@ def plot_prediction_chart(hist_df, pred_df, disease_name, target_col_name, sourc
              ax.set_ylim(bottom=0, top=10) # Default if no valid numeric data
 
         fig.autofmt_xdate() # Auto-format date labels if needed
-        fig.tight_layout() # Adjust layout
+        # Fixed margins instead of tight_layout, which measures every text artist on each plot
+        fig.subplots_adjust(left=0.08, right=0.97, bottom=0.15, top=0.86 if warning_note else 0.91)
 
         return fig
 
     except Exception as e:
         print(f"[Predict Plot] Error during plotting for {target_type_label}: {e}")
         traceback.print_exc()
-        if fig: plt.close(fig) # Close figure if created before error
+        if fig: _discard_prediction_figure(fig) # Don't reuse a half-drawn figure
         # Return error figure (dark theme)
-        fig_err, ax_err = plt.subplots(figsize=(10, 6))
+        fig_err = Figure(figsize=(10, 6))
+        ax_err = fig_err.subplots()
         error_color = config.PLOT_COLORS_DARK.get('negative_growth', '#FF0000') # Use config color or default red
         fig_err.patch.set_facecolor(config.DARK_PLOT_STYLE.get("figure.facecolor", "#000000")) # Set fig background
         ax_err.set_facecolor(config.DARK_PLOT_STYLE.get("axes.facecolor", "#000000")) # Set axes background
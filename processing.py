@@ -8,6 +8,97 @@ import config # Import configuration
 import traceback # Import traceback
 
 
+def _rolling_mean_and_growth(values, window=7):
+    """
+    Computes the trailing rolling mean (min_periods=1) and the day-over-day growth rate (%)
+    of a 1-D array in one vectorized pass, using running (cumulative) sums and counts instead
+    of re-summing every window. Matches pandas rolling(window, min_periods=1).mean() (NaN
+    entries are skipped, a window with no values is NaN) and pct_change(fill_method=None) * 100
+    with inf/NaN results replaced by 0.
+    """
+    values = np.asarray(values, dtype='float64')
+    n = len(values)
+    avg = np.empty(n)
+    growth = np.zeros(n)
+    if n == 0:
+        return avg, growth
+
+    valid = ~np.isnan(values)
+    running_sum = np.cumsum(np.where(valid, values, 0.0)) # A NaN must not poison every later window
+    running_count = np.cumsum(valid)
+    window_sum = running_sum.copy()
+    window_count = running_count.copy()
+    if n > window:
+        window_sum[window:] -= running_sum[:-window]
+        window_count[window:] -= running_count[:-window]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        avg[:] = np.where(window_count > 0, window_sum / window_count, np.nan)
+
+    previous = values[:-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct = (values[1:] - previous) / previous * 100
+    growth[1:] = np.where(np.isfinite(pct), pct, 0) # x/0 and 0/0 count as no growth
+    return avg, growth
+
+
+def _downcast_features(df, target_col_name):
+    """
+    Stores the columns common_post_processing derives as 32-bit (halving the bytes every
+    plot, stats and model pass reads): the rolling average and growth rate as float32, the
+    target and date features as int32 when they fit. Carried-over raw float columns are
+    left alone, float32 can't hold large cumulative totals exactly.
+    """
+    int32_info = np.iinfo(np.int32)
+    for col in (target_col_name, 'day_of_year', 'month', 'day', 'day_of_week'):
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]) and df[col].dtype.itemsize > 4:
+            values = df[col]
+            if values.empty or (values.min() >= int32_info.min and values.max() <= int32_info.max):
+                df[col] = values.astype(np.int32)
+    for col in (f"{target_col_name}_7d_avg", 'growth_rate'):
+        if col in df.columns and df[col].dtype == np.float64:
+            df[col] = df[col].astype(np.float32)
+    return df
+
+
+def country_row_index(df_raw, country_col, normalize=None):
+    """
+    Maps each country key to the positions of its rows in df_raw (original row order kept).
+    Built once per raw load so single-country preprocessing can start from
+    df_raw.iloc[positions] instead of scanning the whole frame. normalize(name) must
+    reproduce the preprocessor's own country comparison (e.g. strip + lower for Influenza).
+    """
+    col = df_raw[country_col]
+    if not isinstance(col.dtype, pd.CategoricalDtype):
+        col = col.astype('category')
+    names = [str(c) for c in col.cat.categories]
+    if not names:
+        return {}
+    keys, key_of_category = np.unique([normalize(n) if normalize else n for n in names], return_inverse=True)
+    codes = col.cat.codes.to_numpy()
+    row_keys = np.where(codes >= 0, key_of_category[codes], -1) # -1: missing country, never looked up
+    order = np.argsort(row_keys, kind='stable')
+    sorted_keys = row_keys[order]
+    key_ids = np.arange(len(keys))
+    starts = np.searchsorted(sorted_keys, key_ids, side='left')
+    ends = np.searchsorted(sorted_keys, key_ids, side='right')
+    return {str(key): order[start:end] for key, start, end in zip(keys, starts, ends) if end > start}
+
+
+def _country_mask(countries, country, lower=False):
+    """
+    Boolean mask of rows whose stripped (and optionally lower-cased) country name equals country's.
+    Categorical columns (as the loaders produce) are compared once per category instead of
+    converting every row to str; other columns fall back to the row-wise string comparison.
+    """
+    wanted = country.strip().lower() if lower else country.strip()
+    if isinstance(countries.dtype, pd.CategoricalDtype):
+        normalized = (str(name).strip() for name in countries.cat.categories)
+        hits = [code for code, name in enumerate(normalized) if (name.lower() if lower else name) == wanted]
+        return countries.cat.codes.isin(hits)
+    names = countries.astype(str).str.strip()
+    return (names.str.lower() if lower else names) == wanted
+
+
 def preprocess_covid_data(
     df, country_to_process, target_type="Cases", # Added target_type parameter
     relevant_cols=config.COVID_RELEVANT_COLUMNS,
@@ -174,9 +265,7 @@ def preprocess_influenza_data(df_raw, country_to_process):
 
     # Filter for the country (case-insensitive matching recommended)
     try:
-        # Ensure the country column is string type before applying string methods
-        df_raw[raw_country_col] = df_raw[raw_country_col].astype(str)
-        country_df = df_raw[df_raw[raw_country_col].str.strip().str.lower() == country_to_process.strip().lower()].copy()
+        country_df = df_raw[_country_mask(df_raw[raw_country_col], country_to_process, lower=True)].copy()
     except Exception as filter_err:
          print(f"[Influenza Proc] Error filtering country '{country_to_process}': {filter_err}")
          raise ValueError(f"Could not filter Influenza data for country '{country_to_process}'.")
@@ -277,9 +366,7 @@ def preprocess_zika_data(df_raw, country_to_process, target_type="Cases"):
 
     # Filter for the country
     try:
-        # Ensure the country column is string type before filtering
-        df_raw[config.ZIKA_COUNTRY_COL] = df_raw[config.ZIKA_COUNTRY_COL].astype(str)
-        country_df = df_raw[df_raw[config.ZIKA_COUNTRY_COL].str.strip() == country_to_process.strip()].copy()
+        country_df = df_raw[_country_mask(df_raw[config.ZIKA_COUNTRY_COL], country_to_process)].copy()
     except Exception as filter_err:
         print(f"[Zika Proc] Error filtering country '{country_to_process}': {filter_err}")
         raise ValueError(f"Could not filter Zika data for country '{country_to_process}'.")
@@ -445,16 +532,13 @@ def common_post_processing(df_preprocessed, target_col_name):
     # Add Analysis Features (rolling avg, growth rate based on target_col_name)
     if target_col_name in df_processed.columns:
         avg_col_name = f"{target_col_name}_7d_avg" # e.g., 'cases_7d_avg' or 'deaths_7d_avg'
-        df_processed[avg_col_name] = df_processed[target_col_name].rolling(
-            window=7, min_periods=1 # Use min_periods=1 to get avg even at start
-        ).mean()
+        # Rolling 7-day average (min_periods=1) and growth rate (%) from a single running-sum pass
+        rolling_avg, growth_pct = _rolling_mean_and_growth(df_processed[target_col_name].to_numpy(), window=7)
+        df_processed[avg_col_name] = rolling_avg
         print(f"[Common PostProc] Added '{avg_col_name}'.")
 
-        # Calculate growth rate based on the target column
-        # Handle division by zero or NaN resulting from pct_change on zeros
-        pct_change = df_processed[target_col_name].pct_change(fill_method=None) # Don't fill NaNs here yet
-        # Replace inf/-inf with NaN, then multiply by 100, then fill remaining NaNs (from pct_change or inf) with 0
-        df_processed['growth_rate'] = (pct_change.replace([np.inf, -np.inf], np.nan) * 100).fillna(0)
+        # Growth rate based on the target column; division by zero / NaN results are already 0
+        df_processed['growth_rate'] = growth_pct
         print("[Common PostProc] Added 'growth_rate' (based on target column).")
     else:
         # This case should already be caught earlier, but for safety:
@@ -473,8 +557,10 @@ def common_post_processing(df_preprocessed, target_col_name):
             df_processed['month'] = 0 # Fallback
     # Ensure month is integer type for grouping in analysis plot
     df_processed['month'] = df_processed['month'].fillna(0).astype(int)
+    df_processed = _downcast_features(df_processed, target_col_name)
 
 
     print(f"[Common PostProc] Common post-processing completed for target '{target_col_name}'. Final shape: {df_processed.shape}. "
           f"Columns: {list(df_processed.columns)}")
+
     return df_processed
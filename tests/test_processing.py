@@ -0,0 +1,52 @@
+# tests/test_processing.py
+"""Checks the vectorized rolling features against the pandas reference implementation."""
+
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import processing
+
+
+def _pandas_reference(values, window=7):
+    """The pandas expressions _rolling_mean_and_growth replaces."""
+    series = pd.Series(values, dtype='float64')
+    avg = series.rolling(window=window, min_periods=1).mean()
+    pct = series.pct_change(fill_method=None)
+    growth = (pct.replace([np.inf, -np.inf], np.nan) * 100).fillna(0)
+    return avg.to_numpy(), growth.to_numpy()
+
+
+class RollingMeanAndGrowthTest(unittest.TestCase):
+
+    def assert_matches_pandas(self, values, window=7):
+        avg, growth = processing._rolling_mean_and_growth(np.asarray(values, dtype='float64'), window=window)
+        expected_avg, expected_growth = _pandas_reference(values, window=window)
+        np.testing.assert_allclose(avg, expected_avg, rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(growth, expected_growth, rtol=1e-9)
+
+    def test_integer_counts(self):
+        rng = np.random.default_rng(0)
+        self.assert_matches_pandas(rng.integers(0, 500, 400))
+
+    def test_zeros_and_short_series(self):
+        self.assert_matches_pandas([0, 0, 5, 0, 3])
+        self.assert_matches_pandas([7])
+        self.assert_matches_pandas([])
+
+    def test_nan_is_skipped_not_propagated(self):
+        values = [1, 2, np.nan, 4, 5, 6, 7, 8, 9, 10, 11, 12]
+        self.assert_matches_pandas(values)
+        avg, _ = processing._rolling_mean_and_growth(np.asarray(values, dtype='float64'))
+        self.assertFalse(np.isnan(avg).any())
+
+    def test_window_with_only_nan(self):
+        self.assert_matches_pandas([np.nan, np.nan, 3, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, np.nan, 1], window=3)
+
+
+if __name__ == '__main__':
+    unittest.main()
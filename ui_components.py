@@ -7,6 +7,8 @@ import traceback # Added for error reporting in GlowButton command
 import time # For animations
 import math
 import random
+import functools
+import numpy as np
 
 try:
     from PIL import Image, ImageTk, ImageDraw, ImageFilter, ImageEnhance
@@ -21,6 +23,14 @@ except ImportError:
     import sys
     sys.exit(1)
 
+@functools.lru_cache(maxsize=64) # Components redraw from a small fixed palette
+def _hex_to_rgb(hex_color):
+    """'#RRGGBB' (or '#RRGGBBAA', alpha ignored) -> (r, g, b) ints."""
+    h = hex_color.lstrip('#')
+    if len(h) == 8: h = h[:6] # Strip alpha if present
+    if len(h) != 6: raise ValueError(f"Invalid hex color format: {hex_color}")
+    return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+
 # --- GradientFrame Class ---
 class GradientFrame(Canvas):
     """A canvas that creates a gradient background."""
@@ -28,38 +38,34 @@ class GradientFrame(Canvas):
         Canvas.__init__(self, parent, **kwargs)
         self._color1 = color1
         self._color2 = color2
+        self._gradient_size = None # (width, height) the current image was rendered for
+        self._gradient_item = None # Single canvas image item, reused across resizes
         self.bind("<Configure>", self._draw_gradient)
 
     def _draw_gradient(self, event=None):
         """Draw the gradient background on canvas resize."""
-        self.delete("gradient")
-        width = self.winfo_width()
-        height = self.winfo_height()
+        width = event.width if event else self.winfo_width()
+        height = event.height if event else self.winfo_height()
         if width <= 1 or height <= 1: return
+        if (width, height) == self._gradient_size: return # Configure without a size change
 
-        gradient_img = Image.new('RGBA', (width, height), color=self._color1)
-        draw = ImageDraw.Draw(gradient_img)
-        r1, g1, b1 = self._hex_to_rgb(self._color1)
-        r2, g2, b2 = self._hex_to_rgb(self._color2)
-
-        # Draw the gradient (vertical)
-        for y in range(height):
-            factor = y / height
-            r = r1 + (r2 - r1) * factor
-            g = g1 + (g2 - g1) * factor
-            b = b1 + (b2 - b1) * factor
-            color = self._rgb_to_hex(int(r), int(g), int(b))
-            draw.line([(0, y), (width, y)], fill=color)
+        # Vertical gradient: compute one pixel column with NumPy, then stretch it across the width
+        start = np.array(self._hex_to_rgb(self._color1), dtype=float)
+        end = np.array(self._hex_to_rgb(self._color2), dtype=float)
+        factor = (np.arange(height) / height)[:, None]
+        column = (start + (end - start) * factor).astype(np.uint8).reshape(height, 1, 3)
+        gradient_img = Image.fromarray(column, 'RGB').resize((width, height), Image.NEAREST)
 
         self._gradient = ImageTk.PhotoImage(gradient_img)
-        self.create_image(0, 0, anchor="nw", image=self._gradient, tags=("gradient",))
-        self.tag_lower("gradient")
+        self._gradient_size = (width, height)
+        if self._gradient_item is None:
+            self._gradient_item = self.create_image(0, 0, anchor="nw", image=self._gradient, tags=("gradient",))
+            self.tag_lower("gradient")
+        else:
+            self.itemconfig(self._gradient_item, image=self._gradient)
 
     def _hex_to_rgb(self, hex_color):
-        h = hex_color.lstrip('#')
-        if len(h) == 8: h = h[:6] # Strip alpha if present
-        if len(h) != 6: raise ValueError(f"Invalid hex color format: {hex_color}")
-        return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb(hex_color)
 
     def _rgb_to_hex(self, r, g, b):
         return f'#{r:02x}{g:02x}{b:02x}'
@@ -189,10 +195,7 @@ class GlowButton(tk.Frame):
             return ImageTk.PhotoImage(img)
 
     def _hex_to_rgb(self, hex_color):
-        h = hex_color.lstrip('#')
-        if len(h) == 8: h = h[:6] # Strip alpha if present
-        if len(h) != 6: raise ValueError(f"Invalid hex color format: {hex_color}")
-        return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb(hex_color)
 
     def _bind_events(self):
         self.canvas.bind("<Enter>", self._on_enter)
@@ -575,8 +578,7 @@ class ParticleBackground(Canvas):
         return f'#{new_r:02x}{new_g:02x}{new_b:02x}'
     
     def _hex_to_rgb(self, hex_color):
-        h = hex_color.lstrip('#')
-        return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb(hex_color)
     
     def start_animation(self):
         """Start particle animation"""
@@ -640,6 +642,7 @@ class AnimatedLoadingIndicator(Canvas):
         self.color = color
         self.animation_running = False
         self.angle = 0
+        self._arc_styles = self._build_arc_styles()
         
         # Text message below spinner
         self.message = "Loading data..."
@@ -671,31 +674,12 @@ class AnimatedLoadingIndicator(Canvas):
         # Center coordinates
         cx, cy = self.width/2, self.height*0.4
         radius = min(self.width, self.height) * 0.3
+        x0, y0, x1, y1 = cx - radius, cy - radius, cx + radius, cy + radius
         
-        # Draw arcs of the spinner with varying thickness
-        for i in range(8):
-            start_angle = self.angle + i * 45
-            extent = 30
-            thickness = int(10 - i * 1.1)  # Decreasing thickness
-            
-            # Skip if thickness becomes too small
-            if thickness < 1:
-                continue
-                
-            # Calculate arc coordinates
-            x0 = cx - radius
-            y0 = cy - radius
-            x1 = cx + radius
-            y1 = cy + radius
-            
-            # Adjust color based on position in sequence
-            r, g, b = self._hex_to_rgb(self.color)
-            opacity = 255 - i * 30
-            color = f"#{r:02x}{g:02x}{b:02x}{opacity:02x}"
-            
-            # Create arc
+        # Draw arcs of the spinner with precomputed thickness/color (see _build_arc_styles)
+        for offset, thickness, color in self._arc_styles:
             self.create_arc(x0, y0, x1, y1, 
-                          start=start_angle, extent=extent,
+                          start=self.angle + offset, extent=30,
                           style="arc", width=thickness, 
                           outline=color, tags="spinner")
         
@@ -705,10 +689,22 @@ class AnimatedLoadingIndicator(Canvas):
         # Schedule next frame
         self.after(40, self._animate)
         
-    def _hex_to_rgb(self, hex_color):
-        h = hex_color.lstrip('#')
-        if len(h) == 8: h = h[:6]  # Strip alpha if present
-        return tuple(int(h[i:i+2], 16) for i in (0, 2, 4))
+    def _build_arc_styles(self):
+        """Computes (angle offset, width, color) per spinner arc once.
+
+        Tk colors have no alpha channel, so each arc's fade is baked in by blending the
+        spinner color toward the canvas background.
+        """
+        fg = [v // 257 for v in self.winfo_rgb(self.color)]
+        bg = [v // 257 for v in self.winfo_rgb(self.cget("bg"))]
+        styles = []
+        for i in range(8):
+            thickness = int(10 - i * 1.1)  # Decreasing thickness
+            if thickness < 1: continue # Skip if thickness becomes too small
+            opacity = (255 - i * 30) / 255
+            r, g, b = (round(f * opacity + k * (1 - opacity)) for f, k in zip(fg, bg))
+            styles.append((i * 45, thickness, f"#{r:02x}{g:02x}{b:02x}"))
+        return styles
 
 # --- ModernHeader Class ---
 class ModernHeader(Frame):